@@ -0,0 +1,21 @@
+"""
+Personal Assistant - Module Availability Cache
+
+Process-wide record of which modules are importable, shared by the launcher's
+dependency check and the test script's system info so each module is only
+located once per process.
+"""
+
+import importlib.util
+import sys
+
+# Module availability, including misses, resolved at most once per process
+_IMPORT_OK_CACHE = {}
+
+def has_module(module):
+    """Check that a module is importable without executing it"""
+    ok = _IMPORT_OK_CACHE.get(module)
+    if ok is None:
+        ok = module in sys.modules or importlib.util.find_spec(module) is not None
+        _IMPORT_OK_CACHE[module] = ok
+    return ok
@@ -8,15 +8,47 @@ of the personal assistant's capabilities.
 
 import asyncio
 import os
+import sys
 from personal_assistant import PersonalAssistantOrchestrator
 
-async def demo_system_operations():
+# Upper bound on instructions processed at once by the demos
+_CONCURRENCY_LIMIT = min(8, os.cpu_count() or 1)
+
+async def _run_bounded(coros, limit=_CONCURRENCY_LIMIT):
+    """Run coroutines with at most `limit` in flight, returning results in order"""
+    semaphore = asyncio.Semaphore(limit)
+    
+    async def run_one(coro):
+        async with semaphore:
+            return await coro
+    
+    # TaskGroup (Python 3.11+) gives structured cancellation; gather otherwise
+    if hasattr(asyncio, 'TaskGroup'):
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(run_one(coro)) for coro in coros]
+        return [task.result() for task in tasks]
+    return await asyncio.gather(*(run_one(coro) for coro in coros))
+
+async def _process_one(orchestrator, instruction, timeout):
+    """Process one instruction, turning errors into a failed result"""
+    try:
+        return await asyncio.wait_for(orchestrator.process_instruction(instruction), timeout=timeout)
+    except Exception as e:
+        return {
+            'success': False,
+            'instruction': instruction,
+            'results': [{'agent': 'Orchestrator', 'result': {'success': False, 'error': repr(e)}}]
+        }
+
+async def _process_all(orchestrator, instructions, timeout=120):
+    """Process independent instructions concurrently, returning results in order"""
+    return await _run_bounded([_process_one(orchestrator, instruction, timeout) for instruction in instructions])
+
+async def demo_system_operations(orchestrator: PersonalAssistantOrchestrator):
     """Demonstrate system command operations"""
     print("🔧 System Operations Demo")
     print("=" * 50)
     
-    orchestrator = PersonalAssistantOrchestrator()
-    
     examples = [
         "do we have college-photo.jpg in desktop",
         "list all python files in current directory", 
@@ -26,9 +58,10 @@ async def demo_system_operations():
         "what processes are running"
     ]
     
-    for example in examples:
+    results = await _process_all(orchestrator, examples)
+    
+    for example, result in zip(examples, results):
         print(f"\n📋 Instruction: '{example}'")
-        result = await orchestrator.process_instruction(example)
         
         if result['success']:
             print("✅ Success!")
@@ -44,13 +77,11 @@ async def demo_system_operations():
                 if 'error' in agent_result['result']:
                     print(f"   ⚠️  {agent_result['agent']}: {agent_result['result']['error']}")
 
-async def demo_browser_operations():
+async def demo_browser_operations(orchestrator: PersonalAssistantOrchestrator):
     """Demonstrate browser automation operations"""
     print("\n🌐 Browser Operations Demo")
     print("=" * 50)
     
-    orchestrator = PersonalAssistantOrchestrator()
-    
     examples = [
         "open chrome browser",
         "go to google.com",
@@ -74,17 +105,12 @@ async def demo_browser_operations():
             for agent_result in result['results']:
                 if 'error' in agent_result['result']:
                     print(f"   ⚠️  {agent_result['agent']}: {agent_result['result']['error']}")
-        
-        # Add delay between browser operations
-        await asyncio.sleep(2)
 
-async def demo_learning_capabilities():
+async def demo_learning_capabilities(orchestrator: PersonalAssistantOrchestrator):
     """Demonstrate learning and adaptation"""
     print("\n🧠 Learning Capabilities Demo")
     print("=" * 50)
     
-    orchestrator = PersonalAssistantOrchestrator()
-    
     # Simulate repeated similar instructions to show learning
     similar_instructions = [
         "check if photo.jpg exists in desktop",
@@ -95,12 +121,13 @@ async def demo_learning_capabilities():
     
     print("Demonstrating pattern learning with similar instructions:")
     
-    for i, instruction in enumerate(similar_instructions, 1):
+    results = await _process_all(orchestrator, similar_instructions)
+    
+    for i, (instruction, result) in enumerate(zip(similar_instructions, results), 1):
         print(f"\n📋 Instruction {i}: '{instruction}'")
-        result = await orchestrator.process_instruction(instruction)
         
         # Show learning data updates
-        if instruction in str(orchestrator.learning_data):
+        if orchestrator.has_learned_pattern(instruction):
             print("🧠 Learning pattern recognized!")
         
         if result['success']:
@@ -108,13 +135,11 @@ async def demo_learning_capabilities():
         else:
             print("❌ Failed!")
 
-async def demo_complex_scenarios():
+async def demo_complex_scenarios(orchestrator: PersonalAssistantOrchestrator):
     """Demonstrate complex multi-step scenarios"""
     print("\n🎯 Complex Scenarios Demo")
     print("=" * 50)
     
-    orchestrator = PersonalAssistantOrchestrator()
-    
     scenarios = [
         {
             "name": "File Management Workflow",
@@ -146,17 +171,16 @@ async def demo_complex_scenarios():
         print(f"\n📊 Scenario: {scenario['name']}")
         print("-" * 30)
         
-        for instruction in scenario['instructions']:
+        # Steps within a scenario are independent; scenarios stay sequential
+        results = await _process_all(orchestrator, scenario['instructions'])
+        
+        for instruction, result in zip(scenario['instructions'], results):
             print(f"\n📋 Step: '{instruction}'")
-            result = await orchestrator.process_instruction(instruction)
             
             if result['success']:
                 print("   ✅ Success!")
             else:
                 print("   ❌ Failed!")
-            
-            # Brief pause between steps
-            await asyncio.sleep(1)
 
 async def demo_gemini_integration():
     """Demonstrate Gemini CLI integration"""
@@ -175,76 +199,93 @@ async def demo_gemini_integration():
     
     print("✅ Gemini CLI is available")
     
-    # Test instruction understanding
-    print("\n🔹 Testing Enhanced Instruction Understanding...")
-    instruction = "open chrome, go to gmail, and check if I have any new emails"
-    
-    response = await client.understand_instruction(
-        instruction, 
-        ["SystemAgent", "BrowserAgent"]
-    )
-    
-    if response.success:
-        print(f"✅ Gemini understood the instruction!")
-        print(f"📋 Analysis: {response.content[:300]}...")
+    try:
+        # Test instruction understanding
+        print("\n🔹 Testing Enhanced Instruction Understanding...")
+        instruction = "open chrome, go to gmail, and check if I have any new emails"
         
-        if response.metadata and "parsed_instruction" in response.metadata:
-            parsed = response.metadata["parsed_instruction"]
-            print(f"🎯 Agents needed: {parsed.get('agents', [])}")
-            print(f"⏱️  Estimated time: {parsed.get('estimated_duration', 'unknown')} seconds")
-    else:
-        print(f"❌ Gemini analysis failed: {response.error}")
+        response = await client.understand_instruction(
+            instruction, 
+            ["SystemAgent", "BrowserAgent"]
+        )
+        
+        if response.success:
+            print(f"✅ Gemini understood the instruction!")
+            print(f"📋 Analysis: {response.content[:300]}...")
+            
+            if response.metadata and "parsed_instruction" in response.metadata:
+                parsed = response.metadata["parsed_instruction"]
+                print(f"🎯 Agents needed: {parsed.get('agents', [])}")
+                print(f"⏱️  Estimated time: {parsed.get('estimated_duration', 'unknown')} seconds")
+        else:
+            print(f"❌ Gemini analysis failed: {response.error}")
+    finally:
+        await client.close()
+
+_USAGE_EXAMPLES = (
+    ("File Operations", (
+        "do we have college-photo.jpg in desktop",
+        "find all PDF files in documents",
+        "list files in current directory",
+        "show disk space usage",
+        "check if config.yaml exists"
+    )),
+    
+    ("Browser Automation", (
+        "open chrome and go to gmail",
+        "navigate to youtube.com", 
+        "open firefox browser",
+        "go to linkedin and login",
+        "check my emails in gmail"
+    )),
+    
+    ("System Monitoring", (
+        "show running processes",
+        "check memory usage",
+        "display system information",
+        "list installed packages",
+        "check git status"
+    )),
+    
+    ("Complex Tasks", (
+        "find all python files and check which ones import numpy",
+        "backup my desktop files to documents folder",
+        "check if the server is running on port 8080",
+        "download my latest emails and save to text file",
+        "create a summary of today's git commits"
+    ))
+)
+
+_USAGE_TIPS = (
+    "• Be specific about file names and locations",
+    "• Use natural language - the assistant understands context",
+    "• For browser tasks, mention the specific browser (Chrome/Firefox)",
+    "• The assistant learns from your patterns over time",
+    "• Use 'quit' or 'exit' to end interactive sessions"
+)
+
+# Rendered once at import; show_usage_examples() is a single write
+_USAGE_TEXT = "\n".join(
+    ["📚 Personal Assistant - Usage Examples", "=" * 50]
+    + [line
+       for category, commands in _USAGE_EXAMPLES
+       for line in [f"\n🔹 {category}:"] + [f"   • {cmd}" for cmd in commands]]
+    + ["\n💡 Tips:"]
+    + list(_USAGE_TIPS)
+) + "\n"
 
 def show_usage_examples():
     """Display usage examples and tips"""
-    print("📚 Personal Assistant - Usage Examples")
-    print("=" * 50)
-    
-    examples = {
-        "File Operations": [
-            "do we have college-photo.jpg in desktop",
-            "find all PDF files in documents",
-            "list files in current directory",
-            "show disk space usage",
-            "check if config.yaml exists"
-        ],
-        
-        "Browser Automation": [
-            "open chrome and go to gmail",
-            "navigate to youtube.com", 
-            "open firefox browser",
-            "go to linkedin and login",
-            "check my emails in gmail"
-        ],
-        
-        "System Monitoring": [
-            "show running processes",
-            "check memory usage",
-            "display system information",
-            "list installed packages",
-            "check git status"
-        ],
-        
-        "Complex Tasks": [
-            "find all python files and check which ones import numpy",
-            "backup my desktop files to documents folder",
-            "check if the server is running on port 8080",
-            "download my latest emails and save to text file",
-            "create a summary of today's git commits"
-        ]
-    }
-    
-    for category, commands in examples.items():
-        print(f"\n🔹 {category}:")
-        for cmd in commands:
-            print(f"   • {cmd}")
-    
-    print("\n💡 Tips:")
-    print("• Be specific about file names and locations")
-    print("• Use natural language - the assistant understands context")
-    print("• For browser tasks, mention the specific browser (Chrome/Firefox)")
-    print("• The assistant learns from your patterns over time")
-    print("• Use 'quit' or 'exit' to end interactive sessions")
+    sys.stdout.write(_USAGE_TEXT)
+    sys.stdout.flush()
+
+async def _run_demo(demo):
+    """Run one orchestrator demo on a fresh orchestrator, then shut it down"""
+    orchestrator = PersonalAssistantOrchestrator()
+    try:
+        await demo(orchestrator)
+    finally:
+        await orchestrator.shutdown()
 
 async def run_all_demos():
     """Run all demo scenarios"""
@@ -254,14 +295,20 @@ async def run_all_demos():
     # Show usage examples first
     show_usage_examples()
     
-    # Run system operations demo
-    await demo_system_operations()
-    
-    # Run learning demo
-    await demo_learning_capabilities()
-    
-    # Run complex scenarios demo
-    await demo_complex_scenarios()
+    # One orchestrator is shared by all demos
+    orchestrator = PersonalAssistantOrchestrator()
+    try:
+        # Run system operations demo
+        await demo_system_operations(orchestrator)
+        
+        # Run learning demo
+        await demo_learning_capabilities(orchestrator)
+        
+        # Run complex scenarios demo
+        await demo_complex_scenarios(orchestrator)
+    finally:
+        # Checkpoints learning data and releases the HTTP session and browsers
+        await orchestrator.shutdown()
     
     # Run Gemini integration demo (if available)
     await demo_gemini_integration()
@@ -283,13 +330,13 @@ if __name__ == "__main__":
         show_usage_examples()
     else:
         if args.demo == 'system':
-            asyncio.run(demo_system_operations())
+            asyncio.run(_run_demo(demo_system_operations))
         elif args.demo == 'browser':
-            asyncio.run(demo_browser_operations())
+            asyncio.run(_run_demo(demo_browser_operations))
         elif args.demo == 'learning':
-            asyncio.run(demo_learning_capabilities())
+            asyncio.run(_run_demo(demo_learning_capabilities))
         elif args.demo == 'complex':
-            asyncio.run(demo_complex_scenarios())
+            asyncio.run(_run_demo(demo_complex_scenarios))
         elif args.demo == 'gemini':
             asyncio.run(demo_gemini_integration())
         else:
@@ -14,17 +14,89 @@ Features:
 """
 
 import asyncio
+import copy
+import hashlib
 import json
 import logging
 import os
-import subprocess
+import shutil
+import signal
 import tempfile
-from typing import Dict, List, Optional, Any, Union
-from dataclasses import dataclass
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import BinaryIO, Dict, List, Optional, Any, Union
+from dataclasses import dataclass, asdict, replace
 import re
 
+# Optional fast JSON backend (stdlib fallback keeps behavior identical)
+try:
+    import orjson
+    
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+    
+    _loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Response cache for repeated instructions
+_CACHE_CAP = 512
+# Seconds to coalesce cache updates before writing them to disk
+_CACHE_SAVE_DELAY = 2.0
+_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "personal_assistant", "gemini.json")
+
+@lru_cache(maxsize=None)
+def _probe_gemini(gemini_cli_path: str) -> bool:
+    """Check once per path if Gemini CLI is installed and accessible"""
+    # PATH lookup instead of spawning `gemini --version` (a Node.js cold start)
+    available = shutil.which(gemini_cli_path) is not None or (
+        os.path.isabs(gemini_cli_path) and os.access(gemini_cli_path, os.X_OK)
+    )
+    
+    if not available:
+        logger.warning("Gemini CLI not available. Some features may be limited.")
+    return available
+
+# Non-comment, non-blank lines with a leading "$" / ">" / ">>>" prompt removed
+_COMMAND_LINE_RE = re.compile(
+    r'^[ \t]*(?!#|//)(?![$> \t]*$)(?:\$[ \t]*)?(?:>{1,3}[ \t]*)?(\S.*?)[ \t\r]*$',
+    re.MULTILINE
+)
+
+def _find_json_array(text: str) -> Optional[str]:
+    """Return the first balanced JSON array in text, honoring string literals"""
+    start = text.find('[')
+    if start == -1:
+        return None
+    
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == '[':
+            depth += 1
+        elif char == ']':
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
 @dataclass
 class GeminiResponse:
     """Response from Gemini CLI"""
@@ -35,6 +107,105 @@ class GeminiResponse:
     model_used: Optional[str] = None
     tokens_used: Optional[int] = None
 
+def _memory_file() -> BinaryIO:
+    """Anonymous file for capturing CLI output (memory-backed on Linux)"""
+    if hasattr(os, 'memfd_create'):
+        return os.fdopen(os.memfd_create('gemini-output', os.MFD_CLOEXEC), 'w+b')
+    return tempfile.TemporaryFile()
+
+@dataclass
+class GeminiWorker:
+    """A Gemini CLI process and the file its stdout is redirected to"""
+    process: asyncio.subprocess.Process
+    output: BinaryIO
+    
+    def discard(self):
+        """Kill the process group if still running and release stdin and the output file"""
+        if self.process.returncode is None:
+            try:
+                if os.name == 'posix':
+                    os.killpg(self.process.pid, signal.SIGKILL)
+                else:
+                    self.process.kill()
+            except ProcessLookupError:
+                pass
+        if self.process.stdin is not None:
+            self.process.stdin.close()
+        self.output.close()
+    
+    async def close(self):
+        """Discard the worker and wait for its process to be reaped"""
+        self.discard()
+        await self.process.wait()
+
+class GeminiWorkerPool:
+    """Keeps one pre-spawned Gemini CLI process waiting for a prompt on stdin
+    
+    Node.js startup of the CLI dominates short requests, so a spare worker is
+    launched ahead of time and each worker answers a single prompt. A
+    replacement spare is spawned in the background whenever it is taken.
+    """
+    
+    def __init__(self, cmd: List[str], env: Optional[Dict[str, str]] = None):
+        self.cmd = cmd
+        self.env = env
+        self._spare: Optional[GeminiWorker] = None
+        self._replenishing: Optional[asyncio.Future] = None
+    
+    async def _spawn(self, extra_args: Optional[List[str]] = None) -> GeminiWorker:
+        """Launch a Gemini CLI process that reads its prompt from stdin"""
+        # stdout goes to a file rather than a pipe so large replies never stall
+        # on pipe backpressure and are read back with a single read()
+        output = _memory_file()
+        try:
+            # Own process group so discarding a worker also kills the CLI's children
+            process = await asyncio.create_subprocess_exec(
+                *self.cmd, *(extra_args or []),
+                stdin=asyncio.subprocess.PIPE,
+                stdout=output,
+                stderr=asyncio.subprocess.PIPE,
+                env=self.env if self.env is not None else os.environ.copy(),
+                start_new_session=(os.name == 'posix')
+            )
+        except BaseException:
+            output.close()
+            raise
+        return GeminiWorker(process, output)
+    
+    async def _replenish(self):
+        """Spawn the spare worker"""
+        try:
+            self._spare = await self._spawn()
+        except Exception as e:
+            logger.debug(f"Failed to pre-spawn Gemini worker: {e}")
+    
+    def _schedule_replenish(self):
+        if self._spare is None and (self._replenishing is None or self._replenishing.done()):
+            self._replenishing = asyncio.ensure_future(self._replenish())
+    
+    async def acquire(self, extra_args: Optional[List[str]] = None) -> GeminiWorker:
+        """Take the warm spare, or spawn a worker directly for non-default arguments"""
+        if extra_args:
+            return await self._spawn(extra_args)
+        
+        worker, self._spare = self._spare, None
+        if worker is not None and worker.process.returncode is not None:
+            worker.discard()
+            worker = None
+        
+        self._schedule_replenish()
+        return worker or await self._spawn()
+    
+    async def close(self):
+        """Terminate the spare worker and any spawn still in progress"""
+        if self._replenishing is not None:
+            self._replenishing.cancel()
+            await asyncio.gather(self._replenishing, return_exceptions=True)
+            self._replenishing = None
+        if self._spare is not None:
+            worker, self._spare = self._spare, None
+            await worker.close()
+
 class GeminiCLIClient:
     """Client for interacting with Gemini CLI"""
     
@@ -42,25 +213,52 @@ class GeminiCLIClient:
                  gemini_cli_path: str = "gemini",
                  model: str = "gemini-pro",
                  project_id: Optional[str] = None,
-                 api_key: Optional[str] = None):
+                 api_key: Optional[str] = None,
+                 cache_file: Optional[str] = _CACHE_FILE):
         self.gemini_cli_path = gemini_cli_path
         self.model = model
         self.project_id = project_id or os.getenv('GOOGLE_CLOUD_PROJECT')
         self.api_key = api_key or os.getenv('GEMINI_API_KEY')
         
-        # Check if Gemini CLI is available
-        self.available = self._check_availability()
-        if not self.available:
-            logger.warning("Gemini CLI not available. Some features may be limited.")
+        # Environment for CLI subprocesses, built once without touching os.environ
+        self._subprocess_env = {**os.environ}
+        if self.project_id:
+            self._subprocess_env['GOOGLE_CLOUD_PROJECT'] = self.project_id
+        if self.api_key:
+            self._subprocess_env['GEMINI_API_KEY'] = self.api_key
+        
+        # Availability is probed lazily and cached per CLI path
+        self._availability_path = gemini_cli_path
+        
+        # A warm CLI process is started on first chat(); close() terminates it
+        self._pool: Optional[GeminiWorkerPool] = None
+        
+        # LRU of parsed responses, persisted to cache_file (None disables persistence);
+        # read here so no request blocks the event loop on the disk load
+        self._cache: "OrderedDict[str, GeminiResponse]" = OrderedDict()
+        self._cache_file = cache_file
+        self._cache_dirty = False
+        self._cache_save_task: Optional[asyncio.Future] = None
+        self._cache_write_lock = threading.Lock()
+        self._load_cache()
     
-    def _check_availability(self) -> bool:
-        """Check if Gemini CLI is installed and accessible"""
-        try:
-            result = subprocess.run([self.gemini_cli_path, "--version"], 
-                                  capture_output=True, text=True, timeout=10)
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
-            return False
+    async def close(self):
+        """Write pending cache updates and shut down the pre-spawned Gemini CLI worker"""
+        if self._cache_save_task is not None:
+            self._cache_save_task.cancel()
+            await asyncio.gather(self._cache_save_task, return_exceptions=True)
+            self._cache_save_task = None
+        if self._cache_dirty:
+            self._write_cache(self._cache_snapshot())
+        
+        if self._pool:
+            await self._pool.close()
+            self._pool = None
+    
+    @property
+    def available(self) -> bool:
+        """Whether Gemini CLI is installed and accessible"""
+        return _probe_gemini(self._availability_path)
     
     async def chat(self, prompt: str, 
                    context: Optional[str] = None,
@@ -81,51 +279,42 @@ class GeminiCLIClient:
             if self.model:
                 cmd.extend(["-m", self.model])
             
-            # Add project ID if specified
-            if self.project_id:
-                os.environ['GOOGLE_CLOUD_PROJECT'] = self.project_id
-            
-            # Add API key if specified
-            if self.api_key:
-                os.environ['GEMINI_API_KEY'] = self.api_key
+            # Include files in context, passing each parent directory once
+            include_dirs: Dict[str, None] = {}
+            for file_path in include_files or ():
+                directory = os.path.dirname(file_path) or "."
+                if directory not in include_dirs and os.path.exists(file_path):
+                    include_dirs[directory] = None
             
-            # Include files in context
-            if include_files:
-                for file_path in include_files:
-                    if os.path.exists(file_path):
-                        cmd.extend(["--include-directories", os.path.dirname(file_path)])
+            extra_args = []
+            for directory in include_dirs:
+                extra_args.extend(["--include-directories", directory])
             
             # Add context if provided
             full_prompt = prompt
             if context:
                 full_prompt = f"Context: {context}\n\nQuery: {prompt}"
             
-            # Use non-interactive mode
-            cmd.extend(["-p", full_prompt])
-            
-            # Execute command
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                env=os.environ.copy()
-            )
+            # Non-interactive mode: the prompt is piped to a warm worker's stdin
+            if self._pool is None:
+                self._pool = GeminiWorkerPool(cmd, env=self._subprocess_env)
+            worker = await self._pool.acquire(extra_args)
             
             stdout, stderr = await asyncio.wait_for(
-                process.communicate(), timeout=120
+                self._collect_output(worker, full_prompt.encode('utf-8')), timeout=120
             )
             
-            if process.returncode == 0:
+            if worker.process.returncode == 0:
                 return GeminiResponse(
                     success=True,
-                    content=stdout.decode('utf-8').strip(),
+                    content=stdout.decode('utf-8', 'replace').strip(),
                     model_used=self.model
                 )
             else:
                 return GeminiResponse(
                     success=False,
                     content="",
-                    error=stderr.decode('utf-8').strip()
+                    error=stderr.decode('utf-8', 'replace').strip()
                 )
                 
         except asyncio.TimeoutError:
@@ -141,6 +330,104 @@ class GeminiCLIClient:
                 error=f"Gemini CLI error: {str(e)}"
             )
     
+    def _cache_key(self, *parts: str) -> str:
+        """Hash the task name, model and inputs into a cache key"""
+        return hashlib.blake2b("|".join((self.model or "",) + parts).encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _cache_get(self, key: str) -> Optional[GeminiResponse]:
+        """Return a copy of a cached response"""
+        cached = self._cache.get(key)
+        if cached is None:
+            return None
+        
+        self._cache.move_to_end(key)
+        return replace(cached, metadata=copy.deepcopy(cached.metadata))
+    
+    def _cache_put(self, key: str, response: GeminiResponse):
+        """Store a successful response whose reply parsed, evicting the least recently used entry"""
+        if not response.success or response.metadata is None:
+            return
+        
+        self._cache[key] = replace(response, metadata=copy.deepcopy(response.metadata))
+        self._cache.move_to_end(key)
+        while len(self._cache) > _CACHE_CAP:
+            self._cache.popitem(last=False)
+        self._schedule_cache_save()
+    
+    def _load_cache(self):
+        """Load persisted responses from cache_file"""
+        if not self._cache_file:
+            return
+        
+        try:
+            with open(self._cache_file, 'rb') as f:
+                entries = _loads(f.read())
+            for key, fields in entries.items():
+                self._cache[key] = GeminiResponse(**fields)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable Gemini cache {self._cache_file}: {e}")
+    
+    def _schedule_cache_save(self):
+        """Persist the cache in the background, coalescing bursts of updates"""
+        if not self._cache_file:
+            return
+        
+        self._cache_dirty = True
+        if self._cache_save_task is None or self._cache_save_task.done():
+            self._cache_save_task = asyncio.ensure_future(self._save_cache_later())
+    
+    async def _save_cache_later(self):
+        """Write the cache off the event loop once updates settle"""
+        loop = asyncio.get_running_loop()
+        while self._cache_dirty:
+            await asyncio.sleep(_CACHE_SAVE_DELAY)
+            await loop.run_in_executor(None, self._write_cache, self._cache_snapshot())
+    
+    def _cache_snapshot(self) -> List[Any]:
+        """Entries to persist; cached responses are replaced, never mutated"""
+        self._cache_dirty = False
+        return list(self._cache.items())
+    
+    def _write_cache(self, entries: List[Any]):
+        """Atomically persist cache entries to cache_file"""
+        try:
+            with self._cache_write_lock:
+                os.makedirs(os.path.dirname(self._cache_file), exist_ok=True)
+                tmp_file = f"{self._cache_file}.{os.getpid()}.tmp"
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    f.write(_dumps({key: asdict(value) for key, value in entries}))
+                os.replace(tmp_file, self._cache_file)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Failed to persist Gemini cache: {e}")
+    
+    @staticmethod
+    async def _collect_output(worker: GeminiWorker, prompt: bytes):
+        """Send the prompt, wait for the worker to exit and read its output once"""
+        process = worker.process
+        
+        async def feed_stdin():
+            process.stdin.write(prompt)
+            await process.stdin.drain()
+            process.stdin.close()
+        
+        stdin_task = asyncio.ensure_future(feed_stdin())
+        stderr_task = asyncio.ensure_future(process.stderr.read())
+        try:
+            await stdin_task
+            stderr = await stderr_task
+            await process.wait()
+            worker.output.seek(0)
+            stdout = worker.output.read()
+            return stdout, stderr
+        except BaseException:
+            stdin_task.cancel()
+            stderr_task.cancel()
+            raise
+        finally:
+            worker.discard()
+    
     async def analyze_code(self, 
                           code_content: str,
                           language: Optional[str] = None,
@@ -148,14 +435,16 @@ class GeminiCLIClient:
         """Analyze code using Gemini CLI"""
         language_hint = f" (Language: {language})" if language else ""
         
-        prompts = {
-            "analyze": f"Analyze this code{language_hint} and explain what it does:\n\n```\n{code_content}\n```",
-            "debug": f"Debug this code{language_hint} and suggest fixes:\n\n```\n{code_content}\n```",
-            "optimize": f"Optimize this code{language_hint} for better performance:\n\n```\n{code_content}\n```",
-            "explain": f"Explain this code{language_hint} in simple terms:\n\n```\n{code_content}\n```"
+        # Only the selected header is formatted, so code_content is embedded once
+        headers = {
+            "analyze": "Analyze this code{hint} and explain what it does:",
+            "debug": "Debug this code{hint} and suggest fixes:",
+            "optimize": "Optimize this code{hint} for better performance:",
+            "explain": "Explain this code{hint} in simple terms:"
         }
         
-        prompt = prompts.get(task, prompts["analyze"])
+        header = headers.get(task, headers["analyze"]).format(hint=language_hint)
+        prompt = f"{header}\n\n```\n{code_content}\n```"
         return await self.chat(prompt)
     
     async def generate_code(self, 
@@ -174,6 +463,11 @@ class GeminiCLIClient:
                                    instruction: str,
                                    available_agents: List[str]) -> GeminiResponse:
         """Use Gemini to understand user instructions and suggest agent actions"""
+        cache_key = self._cache_key("understand_instruction", instruction, ','.join(sorted(available_agents)))
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
         context = f"""
 You are helping to parse user instructions for a personal assistant system.
 
@@ -209,11 +503,13 @@ Respond in JSON format with this structure:
         if response.success:
             try:
                 # Try to parse JSON response
-                parsed = json.loads(response.content)
+                parsed = _loads(response.content)
                 response.metadata = {"parsed_instruction": parsed}
             except json.JSONDecodeError:
                 # If not JSON, keep original response
                 pass
+            
+            self._cache_put(cache_key, response)
         
         return response
     
@@ -226,7 +522,7 @@ Respond in JSON format with this structure:
 You are helping a personal assistant learn from execution results.
 
 Original instruction: {instruction}
-Execution results: {json.dumps(execution_results, indent=2)}
+Execution results: {_dumps(execution_results)}
 Overall success: {success}
 
 Analyze what went well and what could be improved. Suggest optimizations
@@ -242,6 +538,12 @@ for handling similar instructions in the future.
                                      current_directory: Optional[str] = None,
                                      available_files: Optional[List[str]] = None) -> GeminiResponse:
         """Generate system commands based on natural language instruction"""
+        cache_key = self._cache_key("generate_system_commands", instruction,
+                                    current_directory or "", repr(available_files[:10] if available_files else None))
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
         context = f"""
 You are helping to translate natural language instructions into safe system commands.
 
@@ -264,25 +566,81 @@ Return commands as a JSON array: ["command1", "command2"]
         if response.success:
             try:
                 # Try to extract JSON from response
-                json_match = re.search(r'\[(.*?)\]', response.content, re.DOTALL)
-                if json_match:
-                    commands = json.loads(json_match.group(0))
+                json_array = _find_json_array(response.content)
+                if json_array:
+                    commands = _loads(json_array)
                     response.metadata = {"commands": commands}
             except (json.JSONDecodeError, AttributeError):
                 # If no JSON found, try to extract commands from text
-                lines = response.content.split('\n')
-                commands = []
-                for line in lines:
-                    line = line.strip()
-                    if line and not line.startswith('#') and not line.startswith('//'):
-                        # Remove common prefixes
-                        for prefix in ['$', '>', '>>>']:
-                            if line.startswith(prefix):
-                                line = line[len(prefix):].strip()
-                        if line:
-                            commands.append(line)
+                commands = _COMMAND_LINE_RE.findall(response.content)
                 
                 response.metadata = {"commands": commands[:5]}  # Limit to 5 commands
+            
+            self._cache_put(cache_key, response)
+        
+        return response
+    
+    async def understand_and_plan(self, 
+                                instruction: str,
+                                available_agents: List[str],
+                                current_directory: Optional[str] = None,
+                                available_files: Optional[List[str]] = None) -> GeminiResponse:
+        """Understand an instruction and generate system commands in one CLI call"""
+        cache_key = self._cache_key("understand_and_plan", instruction, ','.join(sorted(available_agents)),
+                                    current_directory or "", repr(available_files[:10] if available_files else None))
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
+        context = f"""
+You are helping a personal assistant system parse a user instruction and plan
+safe system commands for it.
+
+Available agents: {', '.join(available_agents)}
+Current directory: {current_directory or 'unknown'}
+Available files: {available_files[:10] if available_files else 'unknown'}
+
+Determine which agent(s) should handle the instruction, what actions to take,
+and the priority level (low, normal, high, urgent). Also generate safe, read-only
+shell commands that accomplish the request (ls, cd, find, grep, cat, head, tail,
+ps, df, du, which, etc. - AVOID rm, del, sudo, dangerous chmod).
+
+Respond with a single JSON object with this structure:
+{{
+  "parsed_instruction": {{
+    "agents": ["agent_name1"],
+    "actions": [
+      {{
+        "agent": "agent_name",
+        "action": "specific_action",
+        "parameters": {{"key": "value"}},
+        "description": "what this action does"
+      }}
+    ],
+    "priority": "normal",
+    "estimated_duration": 30,
+    "requires_confirmation": false
+  }},
+  "commands": ["command1", "command2"]
+}}
+        """
+        
+        prompt = f"Parse and plan commands for this instruction: '{instruction}'"
+        
+        response = await self.chat(prompt, context=context)
+        
+        if response.success:
+            try:
+                parsed = _loads(response.content)
+                response.metadata = {
+                    "parsed_instruction": parsed.get("parsed_instruction"),
+                    "commands": parsed.get("commands", [])
+                }
+            except (json.JSONDecodeError, AttributeError):
+                # If not JSON, keep original response
+                pass
+            
+            self._cache_put(cache_key, response)
         
         return response
     
@@ -324,9 +682,9 @@ Common action types:
         if response.success:
             try:
                 # Try to parse JSON response
-                json_match = re.search(r'\[(.*?)\]', response.content, re.DOTALL)
-                if json_match:
-                    actions = json.loads(json_match.group(0))
+                json_array = _find_json_array(response.content)
+                if json_array:
+                    actions = _loads(json_array)
                     response.metadata = {"actions": actions}
             except (json.JSONDecodeError, AttributeError):
                 pass
@@ -347,25 +705,29 @@ class EnhancedPromptEngine:
         """Build a context-aware prompt for better understanding"""
         
         prompt_parts = []
+        add = prompt_parts.append
         
         # System context
         if system_context:
-            prompt_parts.append("SYSTEM CONTEXT:")
-            prompt_parts.append(f"Current directory: {system_context.get('cwd', 'unknown')}")
-            prompt_parts.append(f"Operating system: {system_context.get('os', 'unknown')}")
-            prompt_parts.append(f"Available tools: {', '.join(system_context.get('tools', []))}")
-            prompt_parts.append("")
+            tools = ', '.join(system_context.get('tools', ()))
+            prompt_parts.extend((
+                "SYSTEM CONTEXT:",
+                f"Current directory: {system_context.get('cwd', 'unknown')}",
+                f"Operating system: {system_context.get('os', 'unknown')}",
+                f"Available tools: {tools}",
+                ""
+            ))
         
         # User history (for learning patterns)
         if user_history:
-            prompt_parts.append("RECENT USER PATTERNS:")
+            add("RECENT USER PATTERNS:")
             for i, hist_instruction in enumerate(user_history[-3:], 1):
-                prompt_parts.append(f"{i}. {hist_instruction}")
-            prompt_parts.append("")
+                add(f"{i}. {hist_instruction}")
+            add("")
         
         # Main instruction
-        prompt_parts.append("USER INSTRUCTION:")
-        prompt_parts.append(instruction)
+        add("USER INSTRUCTION:")
+        add(instruction)
         
         return "\n".join(prompt_parts)
     
@@ -387,7 +749,7 @@ CAPABILITIES:
 - Learning from user behavior patterns
 
 CURRENT CONTEXT:
-{json.dumps(context, indent=2)}
+{_dumps(context)}
 
 USER INSTRUCTION: "{instruction}"
 
@@ -419,36 +781,32 @@ async def test_gemini_integration():
     
     print("✅ Gemini CLI is available")
     
-    # Test basic chat
-    print("\n🔹 Testing basic chat...")
-    response = await client.chat("Hello! Can you help me understand how to use a personal assistant?")
-    if response.success:
-        print(f"✅ Chat response: {response.content[:100]}...")
-    else:
-        print(f"❌ Chat failed: {response.error}")
-    
-    # Test instruction understanding
-    print("\n🔹 Testing instruction understanding...")
-    instruction = "do we have college-photo.jpg in desktop"
-    response = await client.understand_instruction(instruction, ["SystemAgent", "BrowserAgent"])
-    if response.success:
-        print(f"✅ Instruction analysis: {response.content[:200]}...")
-        if response.metadata and "parsed_instruction" in response.metadata:
-            print(f"📋 Parsed: {response.metadata['parsed_instruction']}")
-    else:
-        print(f"❌ Instruction understanding failed: {response.error}")
-    
-    # Test command generation
-    print("\n🔹 Testing command generation...")
-    response = await client.generate_system_commands(instruction, current_directory="/home/user")
-    if response.success:
-        print(f"✅ Generated commands: {response.content[:200]}...")
-        if response.metadata and "commands" in response.metadata:
-            print(f"📋 Commands: {response.metadata['commands']}")
-    else:
-        print(f"❌ Command generation failed: {response.error}")
-    
-    print("\n✨ Gemini CLI integration test completed!")
+    try:
+        # Test basic chat
+        print("\n🔹 Testing basic chat...")
+        response = await client.chat("Hello! Can you help me understand how to use a personal assistant?")
+        if response.success:
+            print(f"✅ Chat response: {response.content[:100]}...")
+        else:
+            print(f"❌ Chat failed: {response.error}")
+        
+        # Test instruction understanding and command generation in a single call
+        print("\n🔹 Testing instruction understanding and command generation...")
+        instruction = "do we have college-photo.jpg in desktop"
+        response = await client.understand_and_plan(instruction, ["SystemAgent", "BrowserAgent"],
+                                                    current_directory="/home/user")
+        if response.success:
+            print(f"✅ Instruction analysis: {response.content[:200]}...")
+            if response.metadata and response.metadata.get("parsed_instruction"):
+                print(f"📋 Parsed: {response.metadata['parsed_instruction']}")
+            if response.metadata and "commands" in response.metadata:
+                print(f"📋 Commands: {response.metadata['commands']}")
+        else:
+            print(f"❌ Instruction understanding failed: {response.error}")
+        
+        print("\n✨ Gemini CLI integration test completed!")
+    finally:
+        await client.close()
 
 if __name__ == "__main__":
     asyncio.run(test_gemini_integration())
\ No newline at end of file
@@ -14,68 +14,128 @@ Integrates with Gemini CLI and supports local LLMs for enhanced capabilities.
 """
 
 import asyncio
+import atexit
+import heapq
 import json
 import logging
+import math
 import os
+import queue
+import signal
+import stat
 import subprocess
 import sys
+import threading
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Union
-from dataclasses import dataclass, asdict
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, List, Optional, Any, Tuple, Union
+from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
+from fnmatch import fnmatchcase
 import re
 
+# Owner and group names for in-process listings (not available on Windows)
+try:
+    import grp
+    import pwd
+except ImportError:
+    grp = pwd = None
+
 # Third-party imports (will be installed via requirements.txt)
+# Selenium is imported by BrowserAgent on first use to keep startup fast
 try:
     import aiohttp
-    from selenium import webdriver
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    from selenium.webdriver.chrome.options import Options as ChromeOptions
-    from selenium.webdriver.firefox.options import Options as FirefoxOptions
     import yaml
-    from crewai import Agent, Task, Crew, Process
 except ImportError:
     print("Installing required dependencies...")
     subprocess.check_call([sys.executable, "-m", "pip", "install", 
                           "crewai", "selenium", "aiohttp", "pyyaml", "beautifulsoup4", "requests"])
     # Re-import after installation
     import aiohttp
-    from selenium import webdriver
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    from selenium.webdriver.chrome.options import Options as ChromeOptions
-    from selenium.webdriver.firefox.options import Options as FirefoxOptions
     import yaml
-    from crewai import Agent, Task, Crew, Process
 
-# Configure logging
+# Optional fast JSON backend for learning data (stdlib fallback keeps the format)
+try:
+    import orjson
+    
+    def _dumps(obj: Any, indent: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any, indent: bool = False) -> bytes:
+        if indent:
+            return json.dumps(obj, indent=2).encode('utf-8')
+        return json.dumps(obj).encode('utf-8')
+    
+    _loads = json.loads
+
+# Configure logging: file writes are handed to a listener thread, while console
+# output stays on the logging thread so it never interleaves with print()
+_log_queue = queue.SimpleQueue()
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('/tmp/personal_assistant.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
+    handlers=[QueueHandler(_log_queue), logging.StreamHandler(sys.stdout)]
 )
+_log_listener = QueueListener(_log_queue, logging.FileHandler('/tmp/personal_assistant.log'))
+# Started once per process; atexit flushes records still queued at exit
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
-@dataclass
+async def _async_input(prompt: str) -> str:
+    """Read a line from stdin without blocking the event loop
+    
+    A daemon thread is used rather than the default executor so a pending
+    read never keeps the interpreter alive after the loop shuts down.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def resolve(setter, value):
+        if not future.done():
+            setter(value)
+    
+    def read_line():
+        try:
+            line = input(prompt)
+        except BaseException as e:
+            loop.call_soon_threadsafe(resolve, future.set_exception, e)
+        else:
+            loop.call_soon_threadsafe(resolve, future.set_result, line)
+    
+    threading.Thread(target=read_line, daemon=True).start()
+    return await future
+
+# __slots__ dataclasses where supported (Python 3.10+)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+def _truncate(value: Any, limit: int = 200) -> str:
+    """Bounded str(value)[:limit] that never stringifies large payloads in full"""
+    if isinstance(value, str):
+        return value[:limit]
+    if isinstance(value, list):
+        # Only the first `limit` elements can show up; clip command output before stringifying
+        value = [
+            {key: (item[key][:limit] if key in ('stdout', 'stderr') and isinstance(item[key], str) else item[key])
+             for key in item}
+            if isinstance(item, dict) else item
+            for item in value[:limit]
+        ]
+    return str(value)[:limit]
+
+@dataclass(**_DATACLASS_SLOTS)
 class TaskInstruction:
     """Represents a user instruction with context and metadata"""
     instruction: str
-    timestamp: datetime = datetime.now()
-    context: Dict[str, Any] = None
+    timestamp: datetime = field(default_factory=datetime.now)
+    context: Dict[str, Any] = field(default_factory=dict)
     priority: str = "normal"  # low, normal, high, urgent
     estimated_duration: Optional[int] = None  # minutes
-    
-    def __post_init__(self):
-        if self.context is None:
-            self.context = {}
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class AgentResponse:
     """Response from an agent execution"""
     agent_name: str
@@ -83,19 +143,73 @@ class AgentResponse:
     result: Any
     error: Optional[str] = None
     execution_time: Optional[float] = None
-    metadata: Dict[str, Any] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
     
-    def __post_init__(self):
-        if self.metadata is None:
-            self.metadata = {}
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict of the fields, without asdict()'s reflective deep copy"""
+        return {
+            'agent_name': self.agent_name,
+            'success': self.success,
+            'result': self.result,
+            'error': self.error,
+            'execution_time': self.execution_time,
+            'metadata': self.metadata
+        }
+
+@dataclass(frozen=True)
+class LocalCommand:
+    """A system command served in-process instead of through a shell"""
+    command: str  # Equivalent shell command, reported in results
+    handler: str  # SystemAgent method producing the output
+    args: tuple = ()
+
+# Filename slot of a desktop instruction, only when an image/PDF name is mentioned
+_DESKTOP_FILENAME_RE = re.compile(r'\A(?=.*\.(?:jpg|png|pdf)).*?(\w+[-\w]*\.\w+)', re.DOTALL)
+
+def _desktop_commands(text: str, desktop_path: str, desktop_exists: bool) -> List[Union[str, LocalCommand]]:
+    """Desktop handler: list the desktop and look for the mentioned file"""
+    if not desktop_exists:
+        return ["ls ~/Desktop 2>/dev/null || echo 'Desktop directory not found'"]
+    
+    commands = [LocalCommand(f"cd '{desktop_path}' && ls -la", '_list_output', (desktop_path,))]
+    filename_match = _DESKTOP_FILENAME_RE.search(text)
+    if filename_match:
+        filename = filename_match.group(1)
+        commands.append(LocalCommand(
+            f"find '{desktop_path}' -name '*{filename}*' -type f",
+            '_find_output', (desktop_path, f"*{filename}*")
+        ))
+    return commands
+
+def _fixed_commands(*commands: Union[str, LocalCommand]):
+    """Handler for intents that always map to the same commands"""
+    return lambda text, desktop_path, desktop_exists: commands
+
+@lru_cache(maxsize=64)
+def _user_name(uid: int) -> str:
+    """Login name for a uid, or the number when it has none"""
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except (AttributeError, KeyError):
+        return str(uid)
+
+@lru_cache(maxsize=64)
+def _group_name(gid: int) -> str:
+    """Group name for a gid, or the number when it has none"""
+    try:
+        return grp.getgrgid(gid).gr_name
+    except (AttributeError, KeyError):
+        return str(gid)
 
 class BaseAgent(ABC):
     """Abstract base class for all agents"""
     
-    def __init__(self, name: str, description: str, gemini_client=None):
+    def __init__(self, name: str, description: str, gemini_client=None, http_session_provider=None):
         self.name = name
         self.description = description
         self.gemini_client = gemini_client
+        # Coroutine returning the orchestrator's shared aiohttp session
+        self.http_session_provider = http_session_provider
         self.execution_history: List[Dict] = []
     
     @abstractmethod
@@ -107,36 +221,88 @@ class BaseAgent(ABC):
         """Determine if this agent can handle the given instruction"""
         return False
     
+    async def http_session(self) -> Optional['aiohttp.ClientSession']:
+        """Shared HTTP session for LLM calls, or None when running standalone"""
+        if self.http_session_provider is None:
+            return None
+        return await self.http_session_provider()
+    
     def log_execution(self, instruction: TaskInstruction, response: AgentResponse):
         """Log execution for learning purposes"""
         self.execution_history.append({
             'timestamp': datetime.now().isoformat(),
             'instruction': instruction.instruction,
             'success': response.success,
-            'result': str(response.result)[:200],  # Truncate long results
+            'result': _truncate(response.result, 200),  # Truncate long results
             'error': response.error
         })
 
 class SystemAgent(BaseAgent):
     """Agent for system and terminal operations"""
     
-    def __init__(self, gemini_client=None):
+    # Substring keywords (so "files" still matches "file"), scanned in one pass
+    _KEYWORD_RE = re.compile(
+        r'file|directory|folder|desktop|ls|find|search|terminal|command|system|check|exists',
+        re.IGNORECASE
+    )
+    
+    # Command dispatch: the first entry whose keywords all occur in the lowercased
+    # text picks the handler. Keywords match as substrings ("files" has "file").
+    _DISPATCH = {
+        # Example: "do we have college-photo.jpg in desktop"
+        frozenset({'desktop', 'have'}): _desktop_commands,
+        frozenset({'desktop', 'exists'}): _desktop_commands,
+        frozenset({'desktop', 'find'}): _desktop_commands,
+        # Example: "list files in current directory"
+        frozenset({'list', 'file'}): _fixed_commands(LocalCommand("ls -la", '_list_output', ('.',))),
+        # Example: "find all python files"
+        frozenset({'find', 'python'}): _fixed_commands(
+            LocalCommand("find . -name '*.py' -type f", '_find_output', ('.', '*.py'))
+        ),
+        # Example: "check disk space"
+        frozenset({'disk', 'space'}): _fixed_commands("df -h"),
+        # Example: "show running processes"
+        frozenset({'process'}): _fixed_commands("ps aux"),
+        frozenset({'running'}): _fixed_commands("ps aux"),
+    }
+    # Every dispatch keyword, found in one scan; the lookahead also reports overlapping hits
+    _DISPATCH_KEYWORD_RE = re.compile(
+        '(?=(' + '|'.join(sorted({word for key in _DISPATCH for word in key})) + '))'
+    )
+    
+    safe_commands = frozenset({
+        'ls', 'dir', 'pwd', 'cd', 'find', 'locate', 'grep', 'cat', 'head', 'tail',
+        'ps', 'top', 'df', 'du', 'free', 'uname', 'whoami', 'date', 'cal',
+        'which', 'whereis', 'file', 'stat', 'wc', 'sort', 'uniq', 'cut'
+    })
+    
+    # Allow safe commands and common command combinations
+    _SAFE_STARTS = ('cd', 'ls', 'find', 'grep', 'cat', 'head', 'tail', 'pwd', 
+                    'df', 'du', 'ps', 'top', 'which', 'file', 'stat')
+    
+    # Dangerous patterns, matched as substrings anywhere in the command
+    _DANGEROUS_RE = re.compile(
+        r'rm|del|format|fdisk|mkfs|dd|chmod 777|chown|sudo|su|passwd',
+        re.IGNORECASE
+    )
+    
+    # Per-stream output cap for shell commands; larger outputs are cut and the command killed
+    OUTPUT_LIMIT = 1 << 20
+    
+    def __init__(self, gemini_client=None, http_session_provider=None):
         super().__init__(
             name="SystemAgent",
             description="Handles system commands, file operations, and terminal interactions",
-            gemini_client=gemini_client
+            gemini_client=gemini_client,
+            http_session_provider=http_session_provider
         )
-        self.safe_commands = {
-            'ls', 'dir', 'pwd', 'cd', 'find', 'locate', 'grep', 'cat', 'head', 'tail',
-            'ps', 'top', 'df', 'du', 'free', 'uname', 'whoami', 'date', 'cal',
-            'which', 'whereis', 'file', 'stat', 'wc', 'sort', 'uniq', 'cut'
-        }
+        # Resolved once; desktop instructions reuse these instead of re-statting
+        self._desktop = os.path.expanduser("~/Desktop")
+        self._desktop_exists = os.path.isdir(self._desktop)
     
     async def can_handle(self, instruction: TaskInstruction) -> bool:
         """Check if instruction involves system operations"""
-        keywords = ['file', 'directory', 'folder', 'desktop', 'ls', 'find', 'search', 
-                   'terminal', 'command', 'system', 'check', 'exists']
-        return any(keyword in instruction.instruction.lower() for keyword in keywords)
+        return self._KEYWORD_RE.search(instruction.instruction) is not None
     
     async def execute(self, instruction: TaskInstruction) -> AgentResponse:
         """Execute system commands based on natural language instruction"""
@@ -145,20 +311,10 @@ class SystemAgent(BaseAgent):
         try:
             # Parse instruction and determine commands
             commands = await self._parse_instruction_to_commands(instruction)
-            results = []
             
+            # Refuse the whole batch before running anything if a command is unsafe
             for cmd in commands:
-                if self._is_safe_command(cmd):
-                    result = subprocess.run(
-                        cmd, shell=True, capture_output=True, text=True, timeout=30
-                    )
-                    results.append({
-                        'command': cmd,
-                        'stdout': result.stdout,
-                        'stderr': result.stderr,
-                        'returncode': result.returncode
-                    })
-                else:
+                if isinstance(cmd, str) and not self._is_safe_command(cmd):
                     return AgentResponse(
                         agent_name=self.name,
                         success=False,
@@ -166,11 +322,13 @@ class SystemAgent(BaseAgent):
                         error=f"Command '{cmd}' is not in safe commands list"
                     )
             
+            results = await asyncio.gather(*(self._run_command(cmd) for cmd in commands))
+            
             execution_time = asyncio.get_event_loop().time() - start_time
             response = AgentResponse(
                 agent_name=self.name,
                 success=True,
-                result=results,
+                result=list(results),
                 execution_time=execution_time,
                 metadata={'commands_executed': len(commands)}
             )
@@ -178,7 +336,7 @@ class SystemAgent(BaseAgent):
             self.log_execution(instruction, response)
             return response
             
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             return AgentResponse(
                 agent_name=self.name,
                 success=False,
@@ -193,47 +351,149 @@ class SystemAgent(BaseAgent):
                 error=str(e)
             )
     
-    async def _parse_instruction_to_commands(self, instruction: TaskInstruction) -> List[str]:
-        """Parse natural language instruction into system commands"""
-        text = instruction.instruction.lower()
-        commands = []
+    async def _run_command(self, cmd: Union[str, LocalCommand], timeout: float = 30) -> Dict[str, Any]:
+        """Run a shell command without blocking the event loop"""
+        if isinstance(cmd, LocalCommand):
+            return await self._run_local(cmd, timeout)
         
-        # Example: "do we have college-photo.jpg in desktop"
-        if "desktop" in text and ("have" in text or "exists" in text or "find" in text):
-            desktop_path = os.path.expanduser("~/Desktop")
-            if os.path.exists(desktop_path):
-                commands.append(f"cd '{desktop_path}' && ls -la")
-                # Extract filename if mentioned
-                if ".jpg" in text or ".png" in text or ".pdf" in text:
-                    # Use regex to find filename
-                    filename_match = re.search(r'(\w+[-\w]*\.\w+)', text)
-                    if filename_match:
-                        filename = filename_match.group(1)
-                        commands.append(f"find '{desktop_path}' -name '*{filename}*' -type f")
-            else:
-                commands.append("ls ~/Desktop 2>/dev/null || echo 'Desktop directory not found'")
+        # Own process group so a timeout also kills the shell's children
+        process = await asyncio.create_subprocess_shell(
+            cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+            start_new_session=(os.name == 'posix')
+        )
         
-        # Example: "list files in current directory"
-        elif "list" in text and "file" in text:
-            commands.append("ls -la")
+        def kill():
+            try:
+                if os.name == 'posix':
+                    os.killpg(process.pid, signal.SIGKILL)
+                else:
+                    process.kill()
+            except ProcessLookupError:
+                pass
         
-        # Example: "find all python files"
-        elif "find" in text and "python" in text:
-            commands.append("find . -name '*.py' -type f")
+        async def read_capped(stream) -> Tuple[bytearray, bool]:
+            # Stop reading and kill the command once it exceeds the output cap
+            buffer = bytearray()
+            while True:
+                chunk = await stream.read(65536)
+                if not chunk:
+                    return buffer, False
+                buffer += chunk
+                if len(buffer) > self.OUTPUT_LIMIT:
+                    kill()
+                    del buffer[self.OUTPUT_LIMIT:]
+                    return buffer, True
         
-        # Example: "check disk space"
-        elif "disk" in text and "space" in text:
-            commands.append("df -h")
+        async def collect():
+            outputs = await asyncio.gather(read_capped(process.stdout), read_capped(process.stderr))
+            await process.wait()
+            return outputs
         
-        # Example: "show running processes"
-        elif "process" in text or "running" in text:
-            commands.append("ps aux")
+        try:
+            (stdout, stdout_truncated), (stderr, stderr_truncated) = await asyncio.wait_for(
+                collect(), timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            kill()
+            await process.wait()
+            raise
+        
+        return {
+            'command': cmd,
+            'stdout': stdout.decode('utf-8', 'replace'),
+            'stderr': stderr.decode('utf-8', 'replace'),
+            'returncode': process.returncode,
+            'truncated': stdout_truncated or stderr_truncated
+        }
+    
+    async def _run_local(self, cmd: LocalCommand, timeout: float) -> Dict[str, Any]:
+        """Serve a command in a worker thread with the same result shape as a shell run"""
+        loop = asyncio.get_event_loop()
+        handler = getattr(self, cmd.handler)
+        try:
+            stdout = await asyncio.wait_for(loop.run_in_executor(None, handler, *cmd.args), timeout=timeout)
+        except OSError as e:
+            return {'command': cmd.command, 'stdout': '', 'stderr': str(e), 'returncode': 1, 'truncated': False}
         
-        # Default fallback
-        if not commands:
-            commands.append("pwd && ls -la")
+        return {'command': cmd.command, 'stdout': stdout, 'stderr': '', 'returncode': 0, 'truncated': False}
+    
+    @staticmethod
+    def _list_dir(path: str) -> List[Tuple[str, os.stat_result]]:
+        """List a directory, including . and .., as (name, lstat) pairs sorted by name"""
+        entries = [('.', os.lstat(path)), ('..', os.lstat(os.path.join(path, '..')))]
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    entries.append((entry.name, entry.stat(follow_symlinks=False)))
+                except OSError:
+                    continue
+        entries.sort()
+        return entries
+    
+    @staticmethod
+    def _find(root: str, glob: str) -> List[str]:
+        """Regular files below root whose name matches glob, in find's walk order"""
+        matches = []
         
-        return commands
+        def walk(directory: str):
+            try:
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except OSError:
+                return
+            # Like find, descend into each subdirectory as soon as it is reached
+            for entry in entries:
+                path = os.path.join(directory, entry.name)
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        walk(path)
+                    elif entry.is_file(follow_symlinks=False) and fnmatchcase(entry.name, glob):
+                        matches.append(path)
+                except OSError:
+                    continue
+        
+        walk(root)
+        return matches
+    
+    def _list_output(self, path: str) -> str:
+        """Render _list_dir the way ls -la prints it"""
+        # ls shows the time for files modified within the last six months, else the year
+        recent_after = datetime.now().timestamp() - 15778476
+        rows = []
+        blocks = 0
+        for name, st in self._list_dir(path):
+            blocks += getattr(st, 'st_blocks', 0)
+            if stat.S_ISLNK(st.st_mode):
+                try:
+                    name = f"{name} -> {os.readlink(os.path.join(path, name))}"
+                except OSError:
+                    pass
+            modified = datetime.fromtimestamp(st.st_mtime)
+            when = f"{modified:%H:%M}" if st.st_mtime > recent_after else f" {modified:%Y}"
+            rows.append((
+                stat.filemode(st.st_mode), str(st.st_nlink), _user_name(st.st_uid), _group_name(st.st_gid),
+                str(st.st_size), f"{modified:%b} {modified.day:>2} {when}", name
+            ))
+        
+        width = [max(len(row[i]) for row in rows) for i in range(5)]
+        lines = [f"total {(blocks + 1) // 2}"]
+        for mode, links, user, group, size, date, name in rows:
+            lines.append(
+                f"{mode} {links:>{width[1]}} {user:<{width[2]}} {group:<{width[3]}} {size:>{width[4]}} {date} {name}"
+            )
+        return '\n'.join(lines) + '\n'
+    
+    def _find_output(self, root: str, glob: str) -> str:
+        """Render _find results one path per line, like find"""
+        return ''.join(f"{path}\n" for path in self._find(root, glob))
+    
+    def _pwd_list_output(self) -> str:
+        """Current directory followed by its listing, like pwd && ls -la"""
+        return f"{os.getcwd()}\n" + self._list_output('.')
+    
+    async def _parse_instruction_to_commands(self, instruction: TaskInstruction) -> List[Union[str, LocalCommand]]:
+        """Parse natural language instruction into system commands"""
+        return list(_parse_commands_cached(instruction.instruction.lower(), self._desktop, self._desktop_exists))
     
     def _is_safe_command(self, command: str) -> bool:
         """Check if command is safe to execute"""
@@ -245,36 +505,62 @@ class SystemAgent(BaseAgent):
         main_cmd = cmd_parts[0].split('/')[-1]  # Handle paths like /bin/ls
         
         # Check against dangerous patterns
-        dangerous_patterns = ['rm', 'del', 'format', 'fdisk', 'mkfs', 'dd', 
-                            'chmod 777', 'chown', 'sudo', 'su', 'passwd']
-        
-        for pattern in dangerous_patterns:
-            if pattern in command.lower():
-                return False
-        
-        # Allow safe commands and common command combinations
-        safe_starts = ['cd', 'ls', 'find', 'grep', 'cat', 'head', 'tail', 'pwd', 
-                      'df', 'du', 'ps', 'top', 'which', 'file', 'stat']
+        if self._DANGEROUS_RE.search(command):
+            return False
         
-        return main_cmd in self.safe_commands or any(command.startswith(safe) for safe in safe_starts)
+        return main_cmd in self.safe_commands or command.startswith(self._SAFE_STARTS)
+
+@lru_cache(maxsize=512)
+def _parse_commands_cached(text: str, desktop_path: str, desktop_exists: bool) -> Tuple[Union[str, LocalCommand], ...]:
+    """Map lowercased instruction text to SystemAgent commands; pure, so repeats are cache hits"""
+    keywords = frozenset(SystemAgent._DISPATCH_KEYWORD_RE.findall(text))
+    for required, handler in SystemAgent._DISPATCH.items():
+        if required <= keywords:
+            return tuple(handler(text, desktop_path, desktop_exists))
+    
+    # Default fallback
+    return (LocalCommand("pwd && ls -la", '_pwd_list_output'),)
 
 class BrowserAgent(BaseAgent):
     """Agent for browser automation and web interactions"""
     
-    def __init__(self, gemini_client=None):
+    # Substring keywords, scanned in one pass
+    _KEYWORD_RE = re.compile(
+        r'browser|chrome|firefox|website|login|gmail|email|web|navigate|click|open|url',
+        re.IGNORECASE
+    )
+    
+    # Every matching rule contributes its action, in this order
+    _ACTION_RULES = (
+        # Example: "open chrome and go to gmail"
+        (re.compile(r'chrome|browser'), {'type': 'open_browser', 'browser': 'chrome'}),
+        (re.compile(r'firefox'), {'type': 'open_browser', 'browser': 'firefox'}),
+        # Example: "go to gmail" or "navigate to https://gmail.com"
+        (re.compile(r'gmail'), {'type': 'navigate', 'url': 'https://gmail.com'}),
+        # Example: "login with credentials" - would need secure credential storage
+        (re.compile(r'login'), {'type': 'login', 'service': 'gmail'}),
+        # Example: "open first email"
+        (re.compile(r'first (?:email|mail)'), {'type': 'click_first_email'}),
+    )
+    
+    # Live WebDrivers shared by all BrowserAgents, keyed by browser name
+    _driver_pool: Dict[str, Any] = {}
+    
+    def __init__(self, gemini_client=None, http_session_provider=None):
         super().__init__(
             name="BrowserAgent", 
             description="Handles web browser automation, login, navigation, and interactions",
-            gemini_client=gemini_client
+            gemini_client=gemini_client,
+            http_session_provider=http_session_provider
         )
         self.driver = None
         self.current_browser = None
+        # Explicit wait bound to self.driver, rebuilt whenever the driver changes
+        self._wait = None
     
     async def can_handle(self, instruction: TaskInstruction) -> bool:
         """Check if instruction involves browser operations"""
-        keywords = ['browser', 'chrome', 'firefox', 'website', 'login', 'gmail', 
-                   'email', 'web', 'navigate', 'click', 'open', 'url']
-        return any(keyword in instruction.instruction.lower() for keyword in keywords)
+        return self._KEYWORD_RE.search(instruction.instruction) is not None
     
     async def execute(self, instruction: TaskInstruction) -> AgentResponse:
         """Execute browser automation based on instruction"""
@@ -312,29 +598,7 @@ class BrowserAgent(BaseAgent):
     
     async def _parse_instruction_to_actions(self, instruction: TaskInstruction) -> List[Dict]:
         """Parse natural language instruction into browser actions"""
-        text = instruction.instruction.lower()
-        actions = []
-        
-        # Example: "open chrome and go to gmail"
-        if "chrome" in text or "browser" in text:
-            actions.append({'type': 'open_browser', 'browser': 'chrome'})
-        
-        if "firefox" in text:
-            actions.append({'type': 'open_browser', 'browser': 'firefox'})
-        
-        # Example: "go to gmail" or "navigate to https://gmail.com"
-        if "gmail" in text:
-            actions.append({'type': 'navigate', 'url': 'https://gmail.com'})
-        
-        # Example: "login with credentials" - would need secure credential storage
-        if "login" in text:
-            actions.append({'type': 'login', 'service': 'gmail'})
-        
-        # Example: "open first email"
-        if "first email" in text or "first mail" in text:
-            actions.append({'type': 'click_first_email'})
-        
-        return actions
+        return [dict(action) for action in _parse_actions_cached(instruction.instruction.lower())]
     
     async def _execute_browser_action(self, action: Dict, instruction: TaskInstruction) -> Dict:
         """Execute a specific browser action"""
@@ -358,23 +622,43 @@ class BrowserAgent(BaseAgent):
             return {'success': False, 'error': str(e)}
     
     async def _open_browser(self, browser: str = 'chrome') -> Dict:
-        """Open a web browser"""
+        """Open a web browser, reusing a pooled driver when one is alive"""
+        browser = browser.lower()
         try:
-            if self.driver:
-                self.driver.quit()
+            from selenium.webdriver.support.ui import WebDriverWait
+            
+            driver = self._driver_pool.get(browser)
+            if driver is not None:
+                try:
+                    # Reset the page between tasks instead of relaunching
+                    driver.get('about:blank')
+                    self.driver = driver
+                    self._wait = WebDriverWait(driver, 10)
+                    self.current_browser = browser
+                    return {'success': True, 'message': f'Reusing open {browser} browser'}
+                except Exception:
+                    # Driver died (window closed, session lost); start a new one
+                    self._driver_pool.pop(browser, None)
+            
+            from selenium import webdriver
             
-            if browser.lower() == 'chrome':
+            if browser == 'chrome':
+                from selenium.webdriver.chrome.options import Options as ChromeOptions
                 options = ChromeOptions()
                 options.add_argument('--no-sandbox')
                 options.add_argument('--disable-dev-shm-usage')
                 # Remove headless for user interaction
                 # options.add_argument('--headless')  
-                self.driver = webdriver.Chrome(options=options)
+                driver = webdriver.Chrome(options=options)
             else:  # firefox
+                from selenium.webdriver.firefox.options import Options as FirefoxOptions
                 options = FirefoxOptions()
                 # options.add_argument('--headless')
-                self.driver = webdriver.Firefox(options=options)
+                driver = webdriver.Firefox(options=options)
             
+            self._driver_pool[browser] = driver
+            self.driver = driver
+            self._wait = WebDriverWait(driver, 10)
             self.current_browser = browser
             return {'success': True, 'message': f'Opened {browser} browser'}
             
@@ -397,9 +681,6 @@ class BrowserAgent(BaseAgent):
         # Note: This is a placeholder - in production, you'd want secure credential storage
         if service == 'gmail':
             try:
-                # Wait for login elements to be present
-                wait = WebDriverWait(self.driver, 10)
-                
                 # This would need actual credential management
                 return {
                     'success': True, 
@@ -412,9 +693,11 @@ class BrowserAgent(BaseAgent):
     async def _click_first_email(self) -> Dict:
         """Click on the first email in Gmail inbox"""
         try:
-            wait = WebDriverWait(self.driver, 10)
+            from selenium.webdriver.common.by import By
+            from selenium.webdriver.support import expected_conditions as EC
+            
             # Gmail inbox structure may vary, this is a general approach
-            first_email = wait.until(
+            first_email = self._wait.until(
                 EC.element_to_be_clickable((By.CSS_SELECTOR, '[role="main"] tr:first-child'))
             )
             first_email.click()
@@ -422,21 +705,51 @@ class BrowserAgent(BaseAgent):
         except Exception as e:
             return {'success': False, 'error': f'Failed to click first email: {str(e)}'}
     
-    def __del__(self):
-        """Cleanup browser driver"""
-        if self.driver:
-            self.driver.quit()
+    @classmethod
+    def quit_pooled_drivers(cls):
+        """Quit every pooled browser driver"""
+        while cls._driver_pool:
+            browser, driver = cls._driver_pool.popitem()
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.warning(f"Failed to quit {browser} driver: {str(e)}")
+
+@lru_cache(maxsize=512)
+def _parse_actions_cached(text: str) -> Tuple[Dict, ...]:
+    """Map lowercased instruction text to BrowserAgent action templates (copy before use)"""
+    return tuple(action for pattern, action in BrowserAgent._ACTION_RULES if pattern.search(text))
+
+# Pooled drivers outlive individual agents; make sure browsers close at exit
+atexit.register(BrowserAgent.quit_pooled_drivers)
 
 class PersonalAssistantOrchestrator:
     """Main orchestrator that coordinates all agents"""
     
+    # Full learning_data rewrite every N instructions; updates in between are journaled
+    LEARNING_CHECKPOINT_INTERVAL = 50
+    # Number of learned patterns kept ranked for suggestions
+    SUGGESTION_TOP_K = 5
+    
     def __init__(self, config_path: Optional[str] = None):
         self.config = self._load_config(config_path)
         self.agents: List[BaseAgent] = []
         self.gemini_client = self._init_gemini_client()
+        
+        # Append-only journal of pattern updates since the last checkpoint
+        learning_file = self.config['learning']['data_file']
+        self._learning_journal_file = os.path.splitext(learning_file)[0] + '.jsonl'
+        self._learning_journal = None
+        self._learning_dirty = False
+        self._instructions_since_checkpoint = 0
+        
         self.learning_data = self._load_learning_data()
+        self._top_patterns = self._rank_patterns()
         self._initialize_agents()
         
+        # Shared HTTP session for Gemini/local LLM calls, created on first use
+        self._http: Optional[aiohttp.ClientSession] = None
+        
         logger.info("Personal Assistant Orchestrator initialized")
     
     def _load_config(self, config_path: Optional[str]) -> Dict:
@@ -464,10 +777,14 @@ class PersonalAssistantOrchestrator:
             }
         }
         
-        if config_path and os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                user_config = yaml.safe_load(f)
-            default_config.update(user_config)
+        if config_path:
+            try:
+                with open(config_path, 'r') as f:
+                    user_config = yaml.safe_load(f)
+            except FileNotFoundError:
+                pass
+            else:
+                default_config.update(user_config)
         
         return default_config
     
@@ -479,32 +796,102 @@ class PersonalAssistantOrchestrator:
     
     def _load_learning_data(self) -> Dict:
         """Load learning data from previous interactions"""
+        learning_data = {'user_patterns': {}, 'successful_commands': [], 'failed_commands': []}
+        
         learning_file = self.config['learning']['data_file']
-        if os.path.exists(learning_file):
-            try:
-                with open(learning_file, 'r') as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
-                logger.warning("Invalid learning data file, starting fresh")
+        try:
+            with open(learning_file, 'rb') as f:
+                learning_data = _loads(f.read())
+        except FileNotFoundError:
+            pass
+        except ValueError:
+            logger.warning("Invalid learning data file, starting fresh")
+        
+        # Replay pattern updates journaled after the last checkpoint
+        try:
+            with open(self._learning_journal_file, 'rb') as f:
+                for line in f:
+                    try:
+                        record = _loads(line)
+                    except ValueError:
+                        # A torn final line from an interrupted write
+                        continue
+                    learning_data['user_patterns'][record.pop('pattern')] = record
+        except FileNotFoundError:
+            pass
+        
+        return learning_data
+    
+    def _journal_learning(self, pattern_key: str, pattern_data: Dict):
+        """Append one pattern update to the learning journal"""
+        self._learning_dirty = True
+        if not self.config['learning']['enabled']:
+            return
         
-        return {'user_patterns': {}, 'successful_commands': [], 'failed_commands': []}
+        if self._learning_journal is None:
+            # Unbuffered: each record reaches the file in a single write
+            self._learning_journal = open(self._learning_journal_file, 'ab', buffering=0)
+        self._learning_journal.write(_dumps({'pattern': pattern_key, **pattern_data}) + b'\n')
+    
+    def _maybe_checkpoint_learning(self):
+        """Rewrite learning data every LEARNING_CHECKPOINT_INTERVAL instructions"""
+        self._instructions_since_checkpoint += 1
+        if self._instructions_since_checkpoint >= self.LEARNING_CHECKPOINT_INTERVAL:
+            self._save_learning_data()
     
     def _save_learning_data(self):
         """Save learning data for future use"""
+        self._instructions_since_checkpoint = 0
+        if not self._learning_dirty:
+            return
+        
         if self.config['learning']['enabled']:
             learning_file = self.config['learning']['data_file']
-            with open(learning_file, 'w') as f:
-                json.dump(self.learning_data, f, indent=2)
+            with open(learning_file, 'wb') as f:
+                f.write(_dumps(self.learning_data, indent=True))
+            
+            # Checkpoint now holds everything the journal recorded
+            if self._learning_journal is not None:
+                self._learning_journal.seek(0)
+                self._learning_journal.truncate()
+            else:
+                try:
+                    os.remove(self._learning_journal_file)
+                except FileNotFoundError:
+                    pass
+        
+        self._learning_dirty = False
     
     def _initialize_agents(self):
         """Initialize all available agents"""
         self.agents = [
-            SystemAgent(gemini_client=self.gemini_client),
-            BrowserAgent(gemini_client=self.gemini_client),
+            SystemAgent(gemini_client=self.gemini_client, http_session_provider=self.get_http_session),
+            BrowserAgent(gemini_client=self.gemini_client, http_session_provider=self.get_http_session),
         ]
         
         logger.info(f"Initialized {len(self.agents)} agents: {[agent.name for agent in self.agents]}")
     
+    async def get_http_session(self) -> aiohttp.ClientSession:
+        """Return the pooled HTTP session, creating it inside the running loop"""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=30)
+            )
+        return self._http
+    
+    async def shutdown(self):
+        """Release resources held across instructions"""
+        self._save_learning_data()
+        if self._learning_journal is not None:
+            self._learning_journal.close()
+            self._learning_journal = None
+        
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
+        
+        BrowserAgent.quit_pooled_drivers()
+    
     async def process_instruction(self, instruction_text: str) -> Dict[str, Any]:
         """Main method to process user instructions"""
         instruction = TaskInstruction(instruction=instruction_text)
@@ -512,10 +899,8 @@ class PersonalAssistantOrchestrator:
         logger.info(f"Processing instruction: {instruction_text}")
         
         # Determine which agents can handle this instruction
-        capable_agents = []
-        for agent in self.agents:
-            if await agent.can_handle(instruction):
-                capable_agents.append(agent)
+        can_handle = await asyncio.gather(*(agent.can_handle(instruction) for agent in self.agents))
+        capable_agents = [agent for agent, capable in zip(self.agents, can_handle) if capable]
         
         if not capable_agents:
             return {
@@ -525,32 +910,36 @@ class PersonalAssistantOrchestrator:
                 'suggestions': self._get_instruction_suggestions(instruction_text)
             }
         
-        # Execute with capable agents
+        # Execute with capable agents concurrently
+        agent_results = await asyncio.gather(
+            *(agent.execute(instruction) for agent in capable_agents),
+            return_exceptions=True
+        )
+        
         results = []
-        for agent in capable_agents:
-            try:
-                result = await agent.execute(instruction)
-                results.append({
-                    'agent': agent.name,
-                    'result': asdict(result)
-                })
-                
-                # Learn from successful executions
-                if result.success:
-                    self._learn_from_execution(instruction, agent, result)
-                
-            except Exception as e:
-                logger.error(f"Error executing with {agent.name}: {str(e)}")
+        for agent, result in zip(capable_agents, agent_results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error executing with {agent.name}: {str(result)}")
                 results.append({
                     'agent': agent.name,
                     'result': {
                         'success': False,
-                        'error': str(e)
+                        'error': str(result)
                     }
                 })
+                continue
+            
+            results.append({
+                'agent': agent.name,
+                'result': result.to_dict()
+            })
+            
+            # Learn from successful executions
+            if result.success:
+                self._learn_from_execution(instruction, agent, result)
         
-        # Save learning data
-        self._save_learning_data()
+        # Periodically checkpoint learning data
+        self._maybe_checkpoint_learning()
         
         return {
             'success': any(r['result']['success'] for r in results),
@@ -559,33 +948,80 @@ class PersonalAssistantOrchestrator:
             'timestamp': datetime.now().isoformat()
         }
     
+    @staticmethod
+    def _pattern_key(agent_name: str, instruction_text: str) -> str:
+        """Key under which learning data for an agent/instruction pair is stored"""
+        return f"{agent_name}_{instruction_text[:50]}"
+    
+    def has_learned_pattern(self, instruction_text: str) -> bool:
+        """Check if any agent has learned a pattern for this instruction"""
+        patterns = self.learning_data['user_patterns']
+        return any(self._pattern_key(agent.name, instruction_text) in patterns for agent in self.agents)
+    
     def _learn_from_execution(self, instruction: TaskInstruction, agent: BaseAgent, result: AgentResponse):
         """Learn from successful executions to improve future performance"""
-        pattern_key = f"{agent.name}_{instruction.instruction[:50]}"
+        pattern_key = self._pattern_key(agent.name, instruction.instruction)
         
         if pattern_key not in self.learning_data['user_patterns']:
             self.learning_data['user_patterns'][pattern_key] = {
                 'count': 0,
+                'success_count': 0,
                 'success_rate': 0.0,
                 'avg_execution_time': 0.0,
                 'last_used': None
             }
         
         pattern_data = self.learning_data['user_patterns'][pattern_key]
+        if 'success_count' not in pattern_data:
+            # Patterns saved before success_count existed only carry the rate
+            pattern_data['success_count'] = round(pattern_data['success_rate'] * pattern_data['count'])
         pattern_data['count'] += 1
         pattern_data['last_used'] = datetime.now().isoformat()
         
         if result.execution_time:
-            pattern_data['avg_execution_time'] = (
-                (pattern_data['avg_execution_time'] * (pattern_data['count'] - 1) + result.execution_time) /
-                pattern_data['count']
+            # Running mean: avg += (x - avg) / n
+            pattern_data['avg_execution_time'] += (
+                (result.execution_time - pattern_data['avg_execution_time']) / pattern_data['count']
             )
         
         if result.success:
-            pattern_data['success_rate'] = (
-                (pattern_data['success_rate'] * (pattern_data['count'] - 1) + 1.0) /
-                pattern_data['count']
-            )
+            pattern_data['success_count'] += 1
+        # Kept alongside the counters for readers of the learning data file
+        pattern_data['success_rate'] = pattern_data['success_count'] / pattern_data['count']
+        
+        self._update_top_patterns(pattern_key, pattern_data)
+        self._journal_learning(pattern_key, pattern_data)
+    
+    @staticmethod
+    def _pattern_score(pattern_data: Dict) -> float:
+        """Rank patterns by success rate weighted by how often they are used"""
+        count = pattern_data.get('count', 0)
+        if not count:
+            return 0.0
+        success_count = pattern_data.get('success_count')
+        success_rate = success_count / count if success_count is not None else pattern_data.get('success_rate', 0.0)
+        return success_rate * math.log1p(count)
+    
+    def _rank_patterns(self) -> Dict[str, float]:
+        """Select the top-K learned patterns once from the loaded learning data"""
+        patterns = self.learning_data['user_patterns']
+        top = heapq.nlargest(
+            self.SUGGESTION_TOP_K,
+            ((self._pattern_score(data), key) for key, data in patterns.items())
+        )
+        return {key: score for score, key in top}
+    
+    def _update_top_patterns(self, pattern_key: str, pattern_data: Dict):
+        """Keep the top-K pattern ranking current after a single pattern update"""
+        score = self._pattern_score(pattern_data)
+        top = self._top_patterns
+        if pattern_key in top or len(top) < self.SUGGESTION_TOP_K:
+            top[pattern_key] = score
+            return
+        weakest = min(top, key=top.get)
+        if score > top[weakest]:
+            del top[weakest]
+            top[pattern_key] = score
     
     def _get_instruction_suggestions(self, instruction: str) -> List[str]:
         """Provide suggestions for unsupported instructions"""
@@ -597,9 +1033,11 @@ class PersonalAssistantOrchestrator:
             "Try: 'show disk space'",
         ]
         
-        # Add learned patterns as suggestions
-        for pattern_key in self.learning_data['user_patterns']:
-            if self.learning_data['user_patterns'][pattern_key]['success_rate'] > 0.8:
+        # Add the best learned patterns as suggestions
+        user_patterns = self.learning_data['user_patterns']
+        for pattern_key in sorted(self._top_patterns, key=self._top_patterns.get, reverse=True):
+            pattern_data = user_patterns.get(pattern_key)
+            if pattern_data and pattern_data['success_rate'] > 0.8:
                 # Extract original instruction from pattern
                 original = pattern_key.split('_', 1)[1]
                 suggestions.append(f"Similar to: '{original}...'")
@@ -617,7 +1055,7 @@ class PersonalAssistantOrchestrator:
         
         while True:
             try:
-                instruction = input("You: ").strip()
+                instruction = (await _async_input("You: ")).strip()
                 
                 if instruction.lower() in ['quit', 'exit', 'bye']:
                     print("👋 Goodbye!")
@@ -647,7 +1085,7 @@ class PersonalAssistantOrchestrator:
                 
                 print()  # Empty line for readability
                 
-            except KeyboardInterrupt:
+            except (KeyboardInterrupt, EOFError, asyncio.CancelledError):
                 print("\n👋 Goodbye!")
                 break
             except Exception as e:
@@ -668,13 +1106,16 @@ async def main():
     # Initialize the orchestrator
     orchestrator = PersonalAssistantOrchestrator(config_path=args.config)
     
-    if args.instruction:
-        # Execute single instruction
-        result = await orchestrator.process_instruction(args.instruction)
-        print(json.dumps(result, indent=2))
-    else:
-        # Start interactive mode
-        await orchestrator.interactive_mode()
+    try:
+        if args.instruction:
+            # Execute single instruction
+            result = await orchestrator.process_instruction(args.instruction)
+            print(json.dumps(result, indent=2))
+        else:
+            # Start interactive mode
+            await orchestrator.interactive_mode()
+    finally:
+        await orchestrator.shutdown()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
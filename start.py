@@ -9,42 +9,104 @@ with different modes and configurations.
 import sys
 import os
 import asyncio
+import atexit
+import hashlib
+import json
+import shutil
 import subprocess
+import sysconfig
+import threading
 from datetime import datetime
 
+from depcache import has_module
+
+# Dependency check results, reused while the interpreter and environment are unchanged
+DEPS_CACHE_FILE = os.path.expanduser('~/.cache/personal_assistant/deps.json')
+# Touched after a passing check; while newer than requirements.txt the check is skipped
+DEPS_OK_SENTINEL = os.path.expanduser(
+    f'~/.cache/personal_assistant/.deps_ok_{sys.version_info[0]}.{sys.version_info[1]}'
+)
+# Python version, virtualenv, asyncio and json; any failure among these stops the launcher
+CRITICAL_CHECKS = 4
+# Bumped whenever the set of cached checks changes
+DEPS_CACHE_FORMAT = 2
+REQUIREMENTS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'requirements.txt')
+
+# --verbose re-runs every check and actually executes `gemini --version`
+VERBOSE = '--verbose' in sys.argv[1:]
+ARGS = [arg for arg in sys.argv[1:] if arg != '--verbose']
+
+# One event loop for the launcher, created on first use
+_runner = None
+_loop = None
+
+def _run(coro):
+    """Run a coroutine to completion on the launcher's event loop
+    
+    Like asyncio.run(), Ctrl-C cancels the coroutine so its cleanup runs
+    before KeyboardInterrupt is raised.
+    """
+    global _runner, _loop
+    if hasattr(asyncio, 'Runner'):
+        if _runner is None:
+            _runner = asyncio.Runner()
+            atexit.register(_runner.close)
+        return _runner.run(coro)
+    
+    if _loop is None:
+        _loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+        atexit.register(_loop.close)
+    task = _loop.create_task(coro)
+    try:
+        return _loop.run_until_complete(task)
+    except KeyboardInterrupt:
+        task.cancel()
+        _loop.run_until_complete(asyncio.gather(task, return_exceptions=True))
+        raise
+
+_BANNER = "\n".join([
+    "🤖 Personal Assistant - AI Agent Orchestrator",
+    "=" * 55,
+    "Intelligent multi-agent system for automating your tasks",
+    "Built with Gemini CLI, CrewAI, and Browser Automation",
+    "=" * 55,
+    "",
+]) + "\n"
+
 def print_banner():
     """Print a welcome banner"""
-    print("🤖 Personal Assistant - AI Agent Orchestrator")
-    print("=" * 55)
-    print("Intelligent multi-agent system for automating your tasks")
-    print("Built with Gemini CLI, CrewAI, and Browser Automation")
-    print("=" * 55)
-    print()
+    sys.stdout.write(_BANNER)
 
-def check_dependencies():
-    """Check if basic dependencies are available"""
-    print("🔍 Checking dependencies...")
-    
+def _compute_deps():
+    """Run every dependency check, returning the (name, status, message) tuples
+    and how many of the critical ones failed"""
     checks = []
+    critical_failures = 0
+    
+    def add(name, status, message):
+        nonlocal critical_failures
+        checks.append((name, status, message))
+        if not status and len(checks) <= CRITICAL_CHECKS:
+            critical_failures += 1
     
     # Check Python version
     if sys.version_info >= (3, 8):
-        checks.append(("Python 3.8+", True, f"✅ Python {sys.version.split()[0]}"))
+        add("Python 3.8+", True, f"✅ Python {sys.version.split()[0]}")
     else:
-        checks.append(("Python 3.8+", False, f"❌ Python {sys.version.split()[0]} (upgrade needed)"))
+        add("Python 3.8+", False, f"❌ Python {sys.version.split()[0]} (upgrade needed)")
     
     # Check if virtual environment is active
     venv_active = hasattr(sys, 'real_prefix') or (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix)
-    checks.append(("Virtual Environment", venv_active, "✅ Active" if venv_active else "⚠️  Not active"))
+    add("Virtual Environment", venv_active, "✅ Active" if venv_active else "⚠️  Not active")
     
     # Check for key Python modules
     modules = ['asyncio', 'json', 'logging', 'subprocess', 'datetime']
     for module in modules:
-        try:
-            __import__(module)
-            checks.append((f"Module: {module}", True, "✅ Available"))
-        except ImportError:
-            checks.append((f"Module: {module}", False, "❌ Missing"))
+        if has_module(module):
+            add(f"Module: {module}", True, "✅ Available")
+        else:
+            add(f"Module: {module}", False, "❌ Missing")
     
     # Check for optional dependencies
     optional_deps = [
@@ -54,63 +116,161 @@ def check_dependencies():
     ]
     
     for module, description in optional_deps:
-        try:
-            __import__(module)
-            checks.append((f"{description}", True, "✅ Available"))
-        except ImportError:
-            checks.append((f"{description}", False, "⚠️  Not installed (run setup.sh)"))
+        if has_module(module):
+            add(f"{description}", True, "✅ Available")
+        else:
+            add(f"{description}", False, "⚠️  Not installed (run setup.sh)")
     
-    # Check for Gemini CLI
+    return checks, critical_failures
+
+def _gemini_check():
+    """Check for Gemini CLI; run live since installing it need not touch anything cached"""
+    # Presence on PATH is enough unless verbose
+    if not VERBOSE:
+        path = shutil.which('gemini')
+        return ("Gemini CLI", bool(path), "✅ Available" if path else "⚠️  Not installed")
     try:
-        result = subprocess.run(['gemini', '--version'], capture_output=True, text=True, timeout=5)
+        # Only the exit status matters, so nothing is piped back
+        result = subprocess.run(['gemini', '--version'], stdout=subprocess.DEVNULL,
+                                stderr=subprocess.DEVNULL, timeout=2)
         if result.returncode == 0:
-            checks.append(("Gemini CLI", True, "✅ Available"))
-        else:
-            checks.append(("Gemini CLI", False, "❌ Not working"))
+            return ("Gemini CLI", True, "✅ Available")
+        return ("Gemini CLI", False, "❌ Not working")
     except (FileNotFoundError, subprocess.TimeoutExpired):
-        checks.append(("Gemini CLI", False, "⚠️  Not installed"))
+        return ("Gemini CLI", False, "⚠️  Not installed")
+
+def _deps_cache_key():
+    """Fingerprint of everything the dependency checks depend on"""
+    def mtime(path):
+        try:
+            return os.stat(path).st_mtime
+        except OSError:
+            return None
+    
+    fingerprint = (
+        DEPS_CACHE_FORMAT,
+        sys.version,
+        sys.executable,
+        mtime(REQUIREMENTS_FILE),
+        # Changes whenever packages are installed or removed
+        mtime(sysconfig.get_paths()['purelib']),
+        os.environ.get('PATH', ''),
+    )
+    return hashlib.sha1(repr(fingerprint).encode()).hexdigest()
+
+def _load_cached_deps(key):
+    """Return cached (checks, critical_failures) for this key, or None"""
+    try:
+        with open(DEPS_CACHE_FILE, 'r') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cached.get('key') != key or 'critical_failures' not in cached:
+        return None
+    return [tuple(check) for check in cached['checks']], cached['critical_failures']
+
+def _save_cached_deps(key, checks, critical_failures):
+    """Write the checks atomically so a concurrent launch never reads half a file"""
+    tmp_file = f"{DEPS_CACHE_FILE}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(DEPS_CACHE_FILE), exist_ok=True)
+        with open(tmp_file, 'w') as f:
+            json.dump({'key': key, 'checks': checks, 'critical_failures': critical_failures}, f)
+        os.replace(tmp_file, DEPS_CACHE_FILE)
+    except OSError:
+        pass
+
+def _deps_sentinel_fresh():
+    """True if a previous check passed after requirements.txt last changed"""
+    try:
+        sentinel_mtime = os.stat(DEPS_OK_SENTINEL).st_mtime
+    except OSError:
+        return False
+    try:
+        return sentinel_mtime > os.stat(REQUIREMENTS_FILE).st_mtime
+    except OSError:
+        return True
+
+def _touch_deps_sentinel():
+    """Record a passing dependency check"""
+    try:
+        os.makedirs(os.path.dirname(DEPS_OK_SENTINEL), exist_ok=True)
+        with open(DEPS_OK_SENTINEL, 'a'):
+            pass
+        os.utime(DEPS_OK_SENTINEL)
+    except OSError:
+        pass
+
+def check_dependencies():
+    """Check if basic dependencies are available"""
+    lines = ["🔍 Checking dependencies..."]
+    
+    key = _deps_cache_key()
+    cached = None if VERBOSE else _load_cached_deps(key)
+    if cached is not None:
+        checks, critical_failures = cached
+    else:
+        checks, critical_failures = _compute_deps()
+        _save_cached_deps(key, checks, critical_failures)
     
     # Display results
-    for name, status, message in checks:
-        print(f"  {message}")
+    for name, status, message in checks + [_gemini_check()]:
+        lines.append(f"  {message}")
     
     # Summary
-    critical_failures = sum(1 for name, status, _ in checks[:4] if not status)  # First 4 are critical
     if critical_failures > 0:
-        print(f"\n❌ {critical_failures} critical issues found. Run ./setup.sh first.")
-        return False
+        lines.append(f"\n❌ {critical_failures} critical issues found. Run ./setup.sh first.")
     else:
-        print(f"\n✅ Core dependencies check passed!")
-        return True
+        lines.append(f"\n✅ Core dependencies check passed!")
+    sys.stdout.write('\n'.join(lines) + '\n')
+    return critical_failures == 0
+
+_QUICK_HELP = "\n".join([
+    "\n📚 Quick Help",
+    "-" * 20,
+    "Example commands to try:",
+    "  • 'do we have college-photo.jpg in desktop'",
+    "  • 'list all python files in current directory'",
+    "  • 'open chrome and go to gmail'",
+    "  • 'check disk space'",
+    "  • 'find files containing config'",
+    "",
+    "Commands:",
+    "  • Type 'help' for more assistance",
+    "  • Type 'quit' or 'exit' to end session",
+    "  • Type 'demo' to see example scenarios",
+    "",
+]) + "\n"
 
 def show_quick_help():
     """Show quick help and usage examples"""
-    print("\n📚 Quick Help")
-    print("-" * 20)
-    print("Example commands to try:")
-    print("  • 'do we have college-photo.jpg in desktop'")
-    print("  • 'list all python files in current directory'") 
-    print("  • 'open chrome and go to gmail'")
-    print("  • 'check disk space'")
-    print("  • 'find files containing config'")
-    print()
-    print("Commands:")
-    print("  • Type 'help' for more assistance")
-    print("  • Type 'quit' or 'exit' to end session")
-    print("  • Type 'demo' to see example scenarios")
-    print()
+    sys.stdout.write(_QUICK_HELP)
+
+def _preimport_assistant():
+    """Start importing personal_assistant in the background"""
+    def load():
+        try:
+            __import__('personal_assistant')
+        except Exception:
+            # start_interactive_mode re-imports and reports the error
+            pass
+    
+    threading.Thread(target=load, daemon=True).start()
 
 async def start_interactive_mode():
     """Start the interactive assistant"""
     try:
-        from personal_assistant import PersonalAssistantOrchestrator
-        
         print("🚀 Starting Personal Assistant...")
-        orchestrator = PersonalAssistantOrchestrator()
-        
         show_quick_help()
         
-        await orchestrator.interactive_mode()
+        # Normally finished by _preimport_assistant while help was printed
+        from personal_assistant import PersonalAssistantOrchestrator
+        orchestrator = PersonalAssistantOrchestrator()
+        
+        try:
+            await orchestrator.interactive_mode()
+        finally:
+            await orchestrator.shutdown()
         
     except ImportError as e:
         print(f"❌ Import error: {e}")
@@ -118,6 +278,12 @@ async def start_interactive_mode():
     except Exception as e:
         print(f"❌ Error starting assistant: {e}")
 
+def _exec_script(*args):
+    """Replace the launcher with another script instead of running it as a child"""
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.execv(sys.executable, [sys.executable, *args])
+
 def show_menu():
     """Show main menu options"""
     print("🎯 What would you like to do?")
@@ -130,34 +296,34 @@ def show_menu():
     print("6. ❌ Exit")
     print()
     
+    def start_assistant():
+        _preimport_assistant()
+        print("\n" + "="*50)
+        _run(start_interactive_mode())
+    
+    def run_script(*args):
+        print("\n" + "="*50)
+        _exec_script(*args)
+    
+    actions = {
+        '1': start_assistant,
+        '2': lambda: run_script('test_assistant.py', '--test', 'all'),
+        '3': lambda: run_script('examples.py', '--examples'),
+        '4': lambda: run_script('test_assistant.py', '--info'),
+        '5': show_setup_instructions,
+        '6': lambda: print("👋 Goodbye!"),
+    }
+    
     while True:
         try:
             choice = input("Enter choice (1-6): ").strip()
             
-            if choice == '1':
-                print("\n" + "="*50)
-                asyncio.run(start_interactive_mode())
-                break
-            elif choice == '2':
-                print("\n" + "="*50)
-                subprocess.run([sys.executable, 'test_assistant.py', '--test', 'all'])
-                break
-            elif choice == '3':
-                print("\n" + "="*50)
-                subprocess.run([sys.executable, 'examples.py', '--examples'])
-                break
-            elif choice == '4':
-                print("\n" + "="*50)
-                subprocess.run([sys.executable, 'test_assistant.py', '--info'])
-                break
-            elif choice == '5':
-                show_setup_instructions()
-                break
-            elif choice == '6':
-                print("👋 Goodbye!")
-                break
-            else:
+            action = actions.get(choice)
+            if action is None:
                 print("❌ Invalid choice. Please enter 1-6.")
+                continue
+            action()
+            break
                 
         except KeyboardInterrupt:
             print("\n👋 Goodbye!")
@@ -165,39 +331,49 @@ def show_menu():
         except Exception as e:
             print(f"❌ Error: {e}")
 
+_SETUP_INSTRUCTIONS = "\n".join([
+    "\n📖 Setup Instructions",
+    "=" * 30,
+    "1. Run the setup script:",
+    "   ./setup.sh",
+    "",
+    "2. Get a Gemini API key:",
+    "   • Visit: https://aistudio.google.com/apikey",
+    "   • Add to .env file: GEMINI_API_KEY=your_key_here",
+    "",
+    "3. Optional - Install Gemini CLI:",
+    "   npm install -g @google/gemini-cli",
+    "",
+    "4. Optional - Install local LLM (Ollama):",
+    "   • Visit: https://ollama.ai/",
+    "   • Pull model: ollama pull llama2",
+    "",
+    "5. Start the assistant:",
+    "   python start.py",
+]) + "\n"
+
 def show_setup_instructions():
     """Show setup instructions"""
-    print("\n📖 Setup Instructions")
-    print("=" * 30)
-    print("1. Run the setup script:")
-    print("   ./setup.sh")
-    print()
-    print("2. Get a Gemini API key:")
-    print("   • Visit: https://aistudio.google.com/apikey")
-    print("   • Add to .env file: GEMINI_API_KEY=your_key_here")
-    print()
-    print("3. Optional - Install Gemini CLI:")
-    print("   npm install -g @google/gemini-cli")
-    print()
-    print("4. Optional - Install local LLM (Ollama):")
-    print("   • Visit: https://ollama.ai/")
-    print("   • Pull model: ollama pull llama2")
-    print()
-    print("5. Start the assistant:")
-    print("   python start.py")
+    sys.stdout.write(_SETUP_INSTRUCTIONS)
 
 def main():
     """Main entry point"""
     print_banner()
     
     # Check if this is first run
-    if len(sys.argv) > 1 and sys.argv[1] == '--direct':
+    if ARGS and ARGS[0] == '--direct':
         # Direct mode - start assistant immediately
-        asyncio.run(start_interactive_mode())
+        _preimport_assistant()
+        _run(start_interactive_mode())
         return
     
-    # Check basic dependencies
-    deps_ok = check_dependencies()
+    # Check basic dependencies, unless a previous run already passed
+    if not VERBOSE and _deps_sentinel_fresh():
+        deps_ok = True
+    else:
+        deps_ok = check_dependencies()
+        if deps_ok:
+            _touch_deps_sentinel()
     
     if not deps_ok:
         print("\n❌ Please run setup first: ./setup.sh")
@@ -208,19 +384,21 @@ def main():
     show_menu()
 
 if __name__ == "__main__":
-    if len(sys.argv) > 1:
-        if sys.argv[1] in ['--help', '-h']:
+    if ARGS:
+        if ARGS[0] in ['--help', '-h']:
             print("Personal Assistant Launcher")
             print()
             print("Usage:")
             print("  python start.py           # Show menu")
             print("  python start.py --direct  # Start assistant directly")
+            print("  python start.py --verbose # Re-run all dependency checks, including gemini --version")
             print()
             show_setup_instructions()
-        elif sys.argv[1] == '--direct':
-            asyncio.run(start_interactive_mode())
+        elif ARGS[0] == '--direct':
+            _preimport_assistant()
+            _run(start_interactive_mode())
         else:
-            print(f"Unknown option: {sys.argv[1]}")
+            print(f"Unknown option: {ARGS[0]}")
             print("Use --help for usage information")
     else:
         main()
\ No newline at end of file
@@ -7,12 +7,27 @@ key features without requiring full setup.
 """
 
 import asyncio
+import contextvars
+import copy
+import io
 import sys
 import os
+import time
 from datetime import datetime
+from functools import lru_cache
 
-# Add current directory to path for imports
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+# Add this script's directory to path for imports (already there when run directly)
+here = os.path.dirname(__file__) or '.'
+if here not in sys.path:
+    sys.path.insert(0, here)
+
+from depcache import has_module
+
+@lru_cache(maxsize=1)
+def _get_orchestrator():
+    """Orchestrator shared by every test in this run"""
+    from personal_assistant import PersonalAssistantOrchestrator
+    return PersonalAssistantOrchestrator()
 
 async def test_basic_functionality():
     """Test basic functionality without external dependencies"""
@@ -22,7 +37,7 @@ async def test_basic_functionality():
     try:
         # Test imports
         print("🔹 Testing imports...")
-        from personal_assistant import PersonalAssistantOrchestrator, TaskInstruction, SystemAgent
+        from personal_assistant import TaskInstruction, SystemAgent
         from gemini_integration import GeminiCLIClient
         print("✅ All imports successful")
         
@@ -31,14 +46,14 @@ async def test_basic_functionality():
         instruction = TaskInstruction("test instruction")
         print(f"✅ TaskInstruction created: {instruction.instruction}")
         
-        # Test agent initialization
+        # Test agent initialization (the orchestrator already built one)
         print("\n🔹 Testing agent initialization...")
-        system_agent = SystemAgent()
+        orchestrator = _get_orchestrator()
+        system_agent = next(agent for agent in orchestrator.agents if isinstance(agent, SystemAgent))
         print(f"✅ SystemAgent initialized: {system_agent.name}")
         
         # Test orchestrator initialization
         print("\n🔹 Testing orchestrator initialization...")
-        orchestrator = PersonalAssistantOrchestrator()
         print(f"✅ Orchestrator initialized with {len(orchestrator.agents)} agents")
         
         # Test Gemini client (without requiring actual Gemini CLI)
@@ -60,9 +75,7 @@ async def test_safe_system_operations():
     print("=" * 50)
     
     try:
-        from personal_assistant import PersonalAssistantOrchestrator
-        
-        orchestrator = PersonalAssistantOrchestrator()
+        orchestrator = _get_orchestrator()
         
         # Test safe commands
         safe_instructions = [
@@ -99,20 +112,20 @@ async def test_learning_system():
     print("=" * 40)
     
     try:
-        from personal_assistant import PersonalAssistantOrchestrator
-        
-        orchestrator = PersonalAssistantOrchestrator()
+        orchestrator = _get_orchestrator()
+        # Work on a copy so the shared orchestrator's learning data stays untouched
+        learning_data = copy.deepcopy(orchestrator.learning_data)
         
         print("🔹 Initial learning data:")
-        print(f"   User patterns: {len(orchestrator.learning_data['user_patterns'])}")
-        print(f"   Successful commands: {len(orchestrator.learning_data['successful_commands'])}")
+        print(f"   User patterns: {len(learning_data['user_patterns'])}")
+        print(f"   Successful commands: {len(learning_data['successful_commands'])}")
         
         # Simulate a successful execution for learning
         print("\n🔹 Simulating learning from execution...")
         
         # This would normally happen during actual instruction processing
         pattern_key = "test_pattern"
-        orchestrator.learning_data['user_patterns'][pattern_key] = {
+        learning_data['user_patterns'][pattern_key] = {
             'count': 1,
             'success_rate': 1.0,
             'avg_execution_time': 0.5,
@@ -134,11 +147,9 @@ def test_configuration_loading():
     print("=" * 45)
     
     try:
-        from personal_assistant import PersonalAssistantOrchestrator
-        
         # Test with default configuration
         print("🔹 Testing default configuration...")
-        orchestrator = PersonalAssistantOrchestrator()
+        orchestrator = _get_orchestrator()
         config = orchestrator.config
         
         print("✅ Configuration loaded:")
@@ -155,13 +166,14 @@ def test_configuration_loading():
 
 def show_system_info():
     """Show system information for debugging"""
-    print("\n💻 System Information")
-    print("=" * 30)
-    
-    print(f"Python version: {sys.version}")
-    print(f"Platform: {sys.platform}")
-    print(f"Current directory: {os.getcwd()}")
-    print(f"Python path: {sys.executable}")
+    lines = [
+        "\n💻 System Information",
+        "=" * 30,
+        f"Python version: {sys.version}",
+        f"Platform: {sys.platform}",
+        f"Current directory: {os.getcwd()}",
+        f"Python path: {sys.executable}",
+    ]
     
     # Check for key dependencies
     dependencies = [
@@ -169,54 +181,94 @@ def show_system_info():
         'logging', 'os', 'sys', 're'
     ]
     
-    print("\n📦 Core dependencies:")
+    lines.append("\n📦 Core dependencies:")
     for dep in dependencies:
+        if has_module(dep):
+            lines.append(f"   ✅ {dep}")
+        else:
+            lines.append(f"   ❌ {dep}")
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+# Buffer collecting the current test's output while tests run concurrently
+_test_output = contextvars.ContextVar('_test_output', default=None)
+
+class _TestStdout:
+    """sys.stdout stand-in that routes writes to the running test's buffer"""
+    
+    def __init__(self, stream):
+        self.stream = stream
+    
+    def write(self, text):
+        return (_test_output.get() or self.stream).write(text)
+    
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+async def _run_test(test_name, test_func):
+    """Run one test with its output buffered, returning (name, passed, output)"""
+    buffer = io.StringIO()
+    token = _test_output.set(buffer)
+    try:
+        print(f"\n{'='*20} {test_name} {'='*20}")
         try:
-            __import__(dep)
-            print(f"   ✅ {dep}")
-        except ImportError:
-            print(f"   ❌ {dep}")
+            result = test_func()
+            if asyncio.iscoroutine(result):
+                result = await result
+        except Exception as e:
+            print(f"❌ {test_name} failed with exception: {str(e)}")
+            result = False
+    finally:
+        _test_output.reset(token)
+    return test_name, result, buffer.getvalue()
 
 async def run_comprehensive_test():
     """Run all tests"""
     print("🚀 Personal Assistant - Comprehensive Test Suite")
     print("=" * 70)
     
-    start_time = datetime.now()
+    start_time = time.perf_counter()
     
     # Show system info first
     show_system_info()
     
-    # Run tests
+    # Async tests run concurrently, sync ones afterwards on this thread; each
+    # test's output is buffered and printed in the listed order
     tests = [
-        ("Basic Functionality", test_basic_functionality()),
-        ("Configuration Loading", test_configuration_loading()),
-        ("Learning System", test_learning_system()),
-        ("Safe System Operations", test_safe_system_operations()),
+        ("Basic Functionality", test_basic_functionality),
+        ("Configuration Loading", test_configuration_loading),
+        ("Learning System", test_learning_system),
+        ("Safe System Operations", test_safe_system_operations),
     ]
     
-    results = []
-    for test_name, test_coro in tests:
-        print(f"\n{'='*20} {test_name} {'='*20}")
-        try:
-            result = await test_coro if asyncio.iscoroutine(test_coro) else test_coro
-            results.append((test_name, result))
-        except Exception as e:
-            print(f"❌ {test_name} failed with exception: {str(e)}")
-            results.append((test_name, False))
+    stdout = sys.stdout
+    sys.stdout = _TestStdout(stdout)
+    try:
+        runs = await asyncio.gather(*(
+            _run_test(test_name, test_func) for test_name, test_func in tests
+            if asyncio.iscoroutinefunction(test_func)
+        ))
+        for test_name, test_func in tests:
+            if not asyncio.iscoroutinefunction(test_func):
+                runs.append(await _run_test(test_name, test_func))
+    finally:
+        sys.stdout = stdout
+    
+    finished = {run[0]: run for run in runs}
+    results = [finished[test_name] for test_name, _ in tests]
+    for _, _, output in results:
+        sys.stdout.write(output)
     
     # Summary
-    end_time = datetime.now()
-    duration = (end_time - start_time).total_seconds()
+    duration = time.perf_counter() - start_time
     
     print(f"\n{'='*70}")
     print("📊 TEST SUMMARY")
     print(f"{'='*70}")
     
-    passed = sum(1 for _, result in results if result)
+    passed = sum(1 for _, result, _ in results if result)
     total = len(results)
     
-    for test_name, result in results:
+    for test_name, result, _ in results:
         status = "✅ PASS" if result else "❌ FAIL"
         print(f"{status:<8} {test_name}")
     
@@ -232,69 +284,84 @@ async def run_comprehensive_test():
     else:
         print(f"\n⚠️  {total - passed} test(s) failed. Check the output above for details.")
 
+_DEMO_SCENARIOS = (
+    {
+        "instruction": "do we have college-photo.jpg in desktop",
+        "expected": "Navigate to Desktop directory and search for the file",
+        "agents": ["SystemAgent"]
+    },
+    {
+        "instruction": "open chrome and go to gmail", 
+        "expected": "Launch Chrome browser and navigate to Gmail",
+        "agents": ["BrowserAgent"]
+    },
+    {
+        "instruction": "find all python files in current directory",
+        "expected": "Search for *.py files using system commands",
+        "agents": ["SystemAgent"]
+    },
+    {
+        "instruction": "check if development server is running on port 8080",
+        "expected": "Check system processes and network connections",
+        "agents": ["SystemAgent"]
+    },
+)
+
+_DEMO_TEXT = "\n".join(
+    ["\n🎬 Quick Demo - Expected Functionality", "=" * 50]
+    + [line
+       for i, scenario in enumerate(_DEMO_SCENARIOS, 1)
+       for line in (
+           f"\n{i}. Instruction: '{scenario['instruction']}'",
+           f"   Expected: {scenario['expected']}",
+           f"   Agents: {', '.join(scenario['agents'])}",
+       )]
+    + [
+        "\n💡 The personal assistant will:",
+        "   • Parse natural language instructions",
+        "   • Determine which agents can handle the task",
+        "   • Execute safe system commands or browser actions",
+        "   • Learn from successful executions",
+        "   • Provide helpful error messages and suggestions",
+    ]
+) + "\n"
+
+async def _run_with_shutdown(test_func):
+    """Run a test entry point, then shut down the shared orchestrator if one was built"""
+    try:
+        result = test_func()
+        if asyncio.iscoroutine(result):
+            await result
+    finally:
+        if _get_orchestrator.cache_info().currsize:
+            await _get_orchestrator().shutdown()
+            _get_orchestrator.cache_clear()
+
 def show_quick_demo():
     """Show a quick demo of expected functionality"""
-    print("\n🎬 Quick Demo - Expected Functionality")
-    print("=" * 50)
-    
-    demo_scenarios = [
-        {
-            "instruction": "do we have college-photo.jpg in desktop",
-            "expected": "Navigate to Desktop directory and search for the file",
-            "agents": ["SystemAgent"]
-        },
-        {
-            "instruction": "open chrome and go to gmail", 
-            "expected": "Launch Chrome browser and navigate to Gmail",
-            "agents": ["BrowserAgent"]
-        },
-        {
-            "instruction": "find all python files in current directory",
-            "expected": "Search for *.py files using system commands",
-            "agents": ["SystemAgent"]
-        },
-        {
-            "instruction": "check if development server is running on port 8080",
-            "expected": "Check system processes and network connections",
-            "agents": ["SystemAgent"]
-        }
-    ]
-    
-    for i, scenario in enumerate(demo_scenarios, 1):
-        print(f"\n{i}. Instruction: '{scenario['instruction']}'")
-        print(f"   Expected: {scenario['expected']}")
-        print(f"   Agents: {', '.join(scenario['agents'])}")
-    
-    print(f"\n💡 The personal assistant will:")
-    print("   • Parse natural language instructions")
-    print("   • Determine which agents can handle the task")
-    print("   • Execute safe system commands or browser actions")
-    print("   • Learn from successful executions")
-    print("   • Provide helpful error messages and suggestions")
+    sys.stdout.write(_DEMO_TEXT)
 
 if __name__ == "__main__":
     import argparse
     
+    tests = {
+        'basic': test_basic_functionality,
+        'system': test_safe_system_operations,
+        'learning': test_learning_system,
+        'config': test_configuration_loading,
+        'all': run_comprehensive_test,
+    }
+    
     parser = argparse.ArgumentParser(description='Test Personal Assistant')
-    parser.add_argument('--test', choices=['basic', 'system', 'learning', 'config', 'all'], 
+    parser.add_argument('--test', choices=tests, 
                        default='all', help='Which test to run')
-    parser.add_argument('--demo', action='store_true', help='Show quick demo of functionality')
-    parser.add_argument('--info', action='store_true', help='Show system information only')
+    parser.add_argument('--demo', dest='func', action='store_const', const=show_quick_demo,
+                       help='Show quick demo of functionality')
+    parser.add_argument('--info', dest='func', action='store_const', const=show_system_info,
+                       help='Show system information only')
     
     args = parser.parse_args()
-    
-    if args.info:
-        show_system_info()
-    elif args.demo:
-        show_quick_demo()
+    if args.func:
+        args.func()
     else:
-        if args.test == 'basic':
-            asyncio.run(test_basic_functionality())
-        elif args.test == 'system':
-            asyncio.run(test_safe_system_operations())
-        elif args.test == 'learning':
-            asyncio.run(test_learning_system())
-        elif args.test == 'config':
-            test_configuration_loading()
-        else:
-            asyncio.run(run_comprehensive_test())
\ No newline at end of file
+        asyncio.run(_run_with_shutdown(tests[args.test]))